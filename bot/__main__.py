@@ -6,18 +6,17 @@ import uvicorn
 import uvloop
 from aiogram.utils.i18n import I18n
 from fastapi import FastAPI, Request, Header, HTTPException
-from aiogram import Bot, Dispatcher
+from aiogram import Bot
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 from aiogram.types import Update
 from loguru import logger
 from sqlalchemy import text
 
+from bot.app import TelegramSession, build_dispatcher
 from bot.core.config import settings
 from bot.database import init_database, close_database, BotSetting
 from bot.database.engine import db
-from bot.handlers import router
-from bot.middlewares import register_middleware
 from bot.utils.helpers import get_transactions_count_today, get_total_users
 from bot.utils.logging_config import setup_sentry
 
@@ -26,16 +25,20 @@ WEBHOOK_URL = settings.WEBHOOK_URL
 WEBHOOK_PATH = "/webhook"
 WEBHOOK_PORT = settings.WEBHOOK_PORT
 WEBHOOK_SECRET = settings.WEBHOOK_SECRET
+WEBHOOK_ENDPOINT = f"{WEBHOOK_URL}{WEBHOOK_PATH}"
 
-bot = Bot(token=TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
-dp = Dispatcher()
+# All outgoing calls go to one host; keep more of those connections warm between bursts
+bot_session = TelegramSession(limit=100, limit_per_host=50, keepalive_timeout=60)
+
+bot = Bot(token=TOKEN, session=bot_session, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+# Built once per process, however often this module ends up imported
+dp = build_dispatcher()
+ALLOWED_UPDATES = dp.resolve_used_update_types()
 
 
 async def setup_bot():
     """Common bot setup for both modes"""
     await init_database()
-    register_middleware(dp)
-    dp.include_router(router)
 
     try:
         maintenance, _ = await BotSetting.get_or_create(key="maintenance_mode")
@@ -61,6 +64,16 @@ async def setup_bot():
     logger.info(f"Inline Mode  - {states[bot_info.supports_inline_queries]}")
 
 
+async def ensure_webhook():
+    """Point Telegram at this app's webhook endpoint"""
+    await bot.set_webhook(
+        url=WEBHOOK_ENDPOINT,
+        allowed_updates=ALLOWED_UPDATES,
+        drop_pending_updates=True,
+        secret_token=WEBHOOK_SECRET,
+    )
+
+
 async def on_startup_webhook():
     """Startup for webhook mode"""
     logger.info("Starting bot in WEBHOOK mode...")
@@ -68,12 +81,7 @@ async def on_startup_webhook():
     setup_sentry()
 
     try:
-        await bot.set_webhook(
-            url=f"{WEBHOOK_URL}{WEBHOOK_PATH}",
-            allowed_updates=dp.resolve_used_update_types(),
-            drop_pending_updates=True,
-            secret_token=WEBHOOK_SECRET,
-        )
+        await ensure_webhook()
     except Exception as e:
         logger.error(f"Failed to webhook: {e}")
     logger.success("✅ Bot started in WEBHOOK mode!")
@@ -119,8 +127,9 @@ async def webhook(
         raise HTTPException(status_code=403, detail="Forbidden")
 
     try:
-        json_data = await request.json()
-        update = Update(**json_data)
+        # Validate straight from bytes and mount the bot, so feed_update
+        # does not have to dump and re-validate the whole update
+        update = Update.model_validate_json(await request.body(), context={"bot": bot})
         await dp.feed_update(bot, update)
     except Exception as e:
         logger.exception(f"❌ Error processing update: {e}")
@@ -164,7 +173,7 @@ async def main():
     dp.startup.register(on_startup_polling)
     dp.shutdown.register(on_shutdown)
 
-    await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
+    await dp.start_polling(bot, allowed_updates=ALLOWED_UPDATES)
 
 
 if __name__ == "__main__":
@@ -186,12 +195,27 @@ if __name__ == "__main__":
 
     if settings.USE_WEBHOOK:
         logger.info("🚀 Starting in WEBHOOK mode...")
+        if settings.DEBUG:
+            server_options = {"reload": True}
+        else:
+            server_options = {"workers": settings.WEBHOOK_WORKERS}
+
+        # Reload and multiple workers need an import string to spawn new processes;
+        # a single in-process server gets the app object so this module isn't
+        # imported a second time as bot.__main__
+        if server_options.get("reload") or server_options.get("workers", 1) > 1:
+            target = "bot.__main__:app"
+        else:
+            target = app
+
         uvicorn.run(
-            "bot.__main__:app",
+            target,
             host="0.0.0.0",
             port=WEBHOOK_PORT,
-            reload=True,
+            loop="uvloop",
+            http="httptools",
             log_level="info",
+            **server_options,
         )
     else:
         logger.info("🚀 Starting in POLLING mode...")
@@ -0,0 +1,45 @@
+from typing import Any, Optional
+
+from aiogram import Dispatcher
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiohttp import ClientSession
+
+from bot.handlers import router
+from bot.middlewares import register_middleware
+
+_dispatcher: Optional[Dispatcher] = None
+
+
+class TelegramSession(AiohttpSession):
+    """AiohttpSession whose connector keeps more connections to the API host warm
+
+    aiogram 3.x builds the connector from ``_connector_init`` in ``create_session``
+    and replaces that dict wholesale when a proxy is set, so the extra options are
+    merged in right before every (re)build instead of once at construction.
+    """
+
+    def __init__(self, *, limit_per_host: int = 50, keepalive_timeout: float = 60, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._extra_connector_options = {
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+        }
+
+    async def create_session(self) -> ClientSession:
+        self._connector_init.update(self._extra_connector_options)
+        return await super().create_session()
+
+
+def build_dispatcher() -> Dispatcher:
+    """Return the process-wide dispatcher, wiring middlewares and routers on first call
+
+    Safe to call from every entry point: the shared router can only be attached
+    to one dispatcher, so later calls return the same instance.
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        dispatcher = Dispatcher()
+        register_middleware(dispatcher)
+        dispatcher.include_router(router)
+        _dispatcher = dispatcher
+    return _dispatcher
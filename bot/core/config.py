@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     DEBUG: bool = Field()
     ENVIRONMENT: str = Field()
     ENABLE_LOGS: str = Field()
+    PROFILING_ENABLED: bool = False
     MAINTENANCE_MODE: bool = False
     MAINTENANCE_MESSAGE: str = (
         "🔧 <b>Bot is under maintenance</b>\n\n"
@@ -33,6 +34,9 @@ class Settings(BaseSettings):
     WEBHOOK_URL: str = Field()
     WEBHOOK_PORT: int = Field()
     WEBHOOK_SECRET: str = Field()
+    # FSM state, throttling counters and the maintenance toggle live in process memory,
+    # so more than one worker needs shared storage first
+    WEBHOOK_WORKERS: int = 1
 
     BACKUP_ENABLED: bool = Field()
     BACKUP_PATH: str = Field()
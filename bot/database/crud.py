@@ -2,12 +2,20 @@
 from typing import Any, Type, Optional, Sequence, TypeVar, List, Dict
 
 from sqlalchemy import select, func, update as sqlalchemy_update, delete as sqlalchemy_delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, joinedload
 
 from bot.database.engine import Base, db
 
 T = TypeVar('T', bound='Model')
 
+
+def _eager_load(relationship: Any):
+    """Join many-to-one relationships inline; collections get a separate IN query"""
+    if relationship.property.uselist:
+        return selectinload(relationship)
+    return joinedload(relationship)
+
+
 class Model(Base):
     """Base model class with convenient class methods for use in handlers."""
 
@@ -63,7 +71,7 @@ class Model(Base):
         async with db.session() as session:
             query = select(cls).where(cls.user_id == id_)
             if relationship:
-                query = query.options(selectinload(relationship))
+                query = query.options(_eager_load(relationship))
 
             result = await session.execute(query)
             return result.scalar_one_or_none()
@@ -206,7 +214,7 @@ class Model(Base):
             query = query.where(criteria)
 
             if relationship:
-                query = query.options(selectinload(relationship))
+                query = query.options(_eager_load(relationship))
 
             if order_by is not None:
                 query = query.order_by(order_by)
@@ -239,7 +247,7 @@ class Model(Base):
             query = query.where(criteria)
 
             if relationship:
-                query = query.options(selectinload(relationship))
+                query = query.options(_eager_load(relationship))
 
             result = await session.execute(query)
             return result.scalars().first()
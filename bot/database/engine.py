@@ -2,7 +2,8 @@ import ssl
 from contextlib import asynccontextmanager
 from typing import Optional
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import DeclarativeBase
 
@@ -13,6 +14,16 @@ ssl_context = ssl.create_default_context()
 ssl_context.check_hostname = False
 ssl_context.verify_mode = ssl.CERT_NONE
 
+# Columns that became timestamptz after the tables were first created. create_all
+# never alters existing columns, and asyncpg rejects the aware values the helpers
+# bind for naive ones, so they are converted in place on startup
+TIMESTAMPTZ_COLUMNS = (
+    ("transactions", "date"),
+    ("transactions", "updated_at"),
+    ("users", "created_at"),
+    ("users", "updated_at"),
+)
+
 # ==================== Base Classes ====================
 
 class Base(DeclarativeBase):
@@ -85,6 +96,24 @@ class DatabaseManager:
 
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await self._upgrade_naive_timestamps(conn)
+
+    @staticmethod
+    async def _upgrade_naive_timestamps(conn: AsyncConnection) -> None:
+        """Convert TIMESTAMPTZ_COLUMNS still stored without time zone, reading old values as UTC."""
+        result = await conn.execute(text(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND data_type = 'timestamp without time zone'"
+        ))
+        naive = {(table, column) for table, column in result}
+
+        for table, column in TIMESTAMPTZ_COLUMNS:
+            if (table, column) in naive:
+                # Without USING, Postgres would read the stored values in the session TimeZone
+                await conn.execute(text(
+                    f'ALTER TABLE {table} ALTER COLUMN "{column}" '
+                    f'TYPE TIMESTAMP WITH TIME ZONE USING "{column}" AT TIME ZONE \'UTC\''
+                ))
 
     async def drop_all(self) -> None:
         """Drop all database tables."""
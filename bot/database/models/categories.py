@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import Integer, String, Boolean, ForeignKey, func, DateTime
+from sqlalchemy import Integer, String, Boolean, ForeignKey, func, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from bot.database.crud import Model
@@ -32,4 +32,8 @@ class Category(Model):
     def __repr__(self):
         return f"<Category(id={self.id}, name={self.name}, type={self.type})>"
     def __str__(self):
-        return f"<Category(id={self.id}, name={self.name}, type={self.type})>"
\ No newline at end of file
+        return f"<Category(id={self.id}, name={self.name}, type={self.type})>"
+
+
+# Case-insensitive name lookups compare lower(name) per user
+Index("ix_category_user_lower_name", Category.user_id, func.lower(Category.name))
@@ -1,13 +1,24 @@
 from datetime import datetime
 
 import pytz
-from sqlalchemy import Integer, ForeignKey, String, DateTime, JSON, func, Float
-from sqlalchemy.orm import mapped_column, Mapped, relationship
+from sqlalchemy import Integer, ForeignKey, String, DateTime, JSON, func, Float, Index
+from sqlalchemy.orm import mapped_column, Mapped, relationship, validates
 
 from bot.database.crud import Model
 
+DESCRIPTION_MAX_LENGTH = 500
+
 
 class Transaction(Model):
+    __table_args__ = (
+        # Composite indexes matching the per-user date-range filters and
+        # the newest-first ordering of the history queries
+        Index("ix_tx_user_date", "user_id", "date"),
+        Index("ix_tx_user_type_date", "user_id", "type", "date"),
+        Index("ix_tx_user_category_date", "user_id", "category_id", "date"),
+        Index("ix_tx_created_at", "created_at"),
+    )
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), index=True)
     category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), index=True)
@@ -15,16 +26,16 @@ class Transaction(Model):
     type: Mapped[str] = mapped_column(String(20), index=True)  # 'expense' or 'income'
     amount: Mapped[float] = mapped_column(Float)
     currency: Mapped[str] = mapped_column(String(10), default="UZS")
-    description: Mapped[str] = mapped_column(String(500), default="")
+    description: Mapped[str] = mapped_column(String(DESCRIPTION_MAX_LENGTH), default="")
 
-    date: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), index=True)
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
     payment_method: Mapped[str] = mapped_column(String(50), default="cash")  # cash, card, online
     photo_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     tags: Mapped[list] = mapped_column(JSON, default=list)  # ['food', 'lunch', 'restaurant']
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         server_default=func.now(),
         onupdate=func.now()
     )
@@ -33,5 +44,10 @@ class Transaction(Model):
     user: Mapped["User"] = relationship(back_populates="transactions")
     category: Mapped["Category"] = relationship("Category", back_populates="transactions")
 
+    @validates("description")
+    def _truncate_description(self, key: str, value: str | None) -> str:
+        # Bound the value once on write so long notes never hit the column limit
+        return (value or "")[:DESCRIPTION_MAX_LENGTH]
+
     def __repr__(self):
         return f"<Transaction(id={self.id}, type={self.type}, amount={self.amount})>"
\ No newline at end of file
@@ -3,7 +3,7 @@ from aiogram.types import Message
 
 from bot.core.config import settings
 
-ADMIN_IDS = settings.ADMIN_IDS
+ADMIN_IDS = frozenset(settings.ADMIN_IDS)
 
 class AdminFilter(Filter):
     async def __call__(self, message: Message) -> bool:
@@ -1,3 +1,4 @@
+import asyncio
 import csv
 import io
 from datetime import datetime
@@ -19,9 +20,8 @@ from bot.filters.admin_filter import AdminFilter
 from bot.services.admin_service import BroadcastService
 from bot.services.user_service import UserService
 from bot.utils import measure, get_broadcast_sent_text, get_confirm_broadcast_text, get_broadcast_message, \
-    get_total_users, get_new_users_today, get_active_users_today, get_active_users_week, \
-    get_transactions_count_today, get_transactions_count_total, get_total_transaction_volume, get_user_retention_stats, \
-    get_top_users_by_transactions, get_popular_categories, get_database_size
+    get_total_users, get_active_users_today, get_transactions_count_today, get_transactions_count_total, \
+    get_top_users_by_transactions, get_popular_categories, get_database_size, get_admin_dashboard
 
 admin_router = Router()
 
@@ -30,6 +30,10 @@ class AdminState(StatesGroup):
     confirm_broadcast = State()
 
 
+# Strong references so running broadcasts are not garbage collected
+_broadcast_tasks: set[asyncio.Task] = set()
+
+
 @admin_router.message(Command("maintenance"), AdminFilter())
 async def toggle_maintenance(message: Message):
     """Toggle maintenance mode (admin only)"""
@@ -155,20 +159,36 @@ async def broadcast_message(message: Message, session: AsyncSession, state: FSMC
     )
 
 
+async def run_broadcast(bot: Bot, chat_id: int, text: str) -> None:
+    """Send a broadcast outside the update handler and report the result to the admin"""
+    try:
+        async with db.session() as session:
+            status = await BroadcastService(bot, session).send_broadcast(text=text)
+    except Exception as e:
+        logger.exception(f"Broadcast failed: {e}")
+        status = None
+
+    try:
+        report = get_broadcast_sent_text(status) if status and status["success"] else "Broadcast failed."
+        await bot.send_message(chat_id, report)
+    except Exception as e:
+        # Nothing awaits this task, so a failure here would otherwise go unnoticed
+        logger.exception(f"Failed to report broadcast result to {chat_id}: {e}")
+
+
 @admin_router.callback_query(F.data == "broadcast_confirm")
-async def broadcast_confirm(callback: CallbackQuery, bot: Bot, session: AsyncSession, state: FSMContext):
+async def broadcast_confirm(callback: CallbackQuery, bot: Bot, state: FSMContext):
     await callback.message.delete()
-    broadcast_service = BroadcastService(bot, session)
     data = await state.get_data()
-    status = await broadcast_service.send_broadcast(text=data.get("message", "Broadcast failed."))
 
-    success = status["success"]
-    if not success:
-        await callback.message.answer("Broadcast failed.")
-        return
-    await callback.message.answer(get_broadcast_sent_text(status))
+    # The update is acknowledged right away; the broadcast reports back when it finishes
+    task = asyncio.create_task(
+        run_broadcast(bot, callback.message.chat.id, data.get("message", "Broadcast failed."))
+    )
+    _broadcast_tasks.add(task)
+    task.add_done_callback(_broadcast_tasks.discard)
 
-    await callback.answer()
+    await callback.answer("📢 Broadcast started")
     await state.clear()
 
 
@@ -180,16 +200,17 @@ async def show_statistics(callback: CallbackQuery, session: AsyncSession):
     await callback.message.edit_text("⏳ Gathering statistics...", parse_mode="HTML")
 
     # Gather all stats
-    total_users = await get_total_users(session)
-    new_today = await get_new_users_today(session)
-    active_today = await get_active_users_today(session)
-    active_week = await get_active_users_week(session)
+    stats = await get_admin_dashboard()
+    total_users = stats['total_users']
+    new_today = stats['new_today']
+    active_today = stats['active_today']
+    active_week = stats['active_week']
 
-    txn_today = await get_transactions_count_today(session)
-    txn_total = await get_transactions_count_total(session)
+    txn_today = stats['txn_today']
+    txn_total = stats['txn_total']
 
-    volumes = await get_total_transaction_volume(session)
-    retention = await get_user_retention_stats(session)
+    volumes = stats['volumes']
+    retention = stats['retention']
 
     # Calculate averages
     avg_txn_per_user = round(txn_total / total_users, 1) if total_users > 0 else 0
@@ -291,10 +312,10 @@ async def show_database_info(callback: CallbackQuery, session: AsyncSession):
     users_count = await get_total_users(session)
     txn_count = await get_transactions_count_total(session)
 
-    result = await session.execute(select(func.count(Category.id)))
+    result = await session.execute(select(func.count()).select_from(Category))
     cat_count = result.scalar() or 0
 
-    result = await session.execute(select(func.count(Budget.id)))
+    result = await session.execute(select(func.count()).select_from(Budget))
     budget_count = result.scalar() or 0
 
     response = (
@@ -426,7 +447,7 @@ async def user_info(message: Message, session: AsyncSession):
 
     # Get user's transaction count
     result = await session.execute(
-        select(func.count(Transaction.id))
+        select(func.count())
         .where(Transaction.user_id == user.user_id)
     )
     txn_count = result.scalar() or 0
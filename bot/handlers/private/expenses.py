@@ -5,19 +5,19 @@ from aiogram.fsm.state import StatesGroup, State
 from bot.database import User, Category
 from bot.keyboards.inline import get_category_keyboard
 from bot.services.budget_service import BudgetService
-from bot.services.category_service import CategoryService
-from bot.services.expense_parser import ExpenseParser
+from bot.services.category_service import CategoryInfo, CategoryService
+from bot.services.expense_parser import expense_parser
 from bot.services.transaction_service import TransactionService
 from bot.utils.formatters import format_amount
-from bot.utils.helpers import get_recent_transactions, get_transactions_today, to_user_timezone
+from bot.utils.helpers import get_recent_transactions_lite, get_transactions_today_lite, to_user_timezone
 from aiogram.utils.i18n import gettext as _
 
 expense_router = Router()
-expense_parser = ExpenseParser()
 
 """
 Production-ready expense handler with improved structure and UX
 """
+import asyncio
 from typing import Optional, Dict, Any
 from aiogram import F
 from aiogram.filters import StateFilter
@@ -30,6 +30,8 @@ from loguru import logger
 CASUAL_WORDS = {'hi', 'hello', 'hey', 'thanks', 'thank', 'ok', 'okay', 'yes', 'no', 'bye'}
 MIN_CONFIDENCE_THRESHOLD = 0.4
 AUTO_CREATE_THRESHOLD = 0.75
+# Fast replies arrive before this, so they never pay for a chat action call
+TYPING_INDICATOR_DELAY = 0.4
 
 
 class ExpenseForm(StatesGroup):
@@ -60,24 +62,23 @@ class ExpenseHandler:
         Process natural language input
         Returns True if handled, False otherwise
         """
+        typing_task = None
         try:
             if self._should_skip_input(text):
                 logger.info(f"Skipping invalid input: {text[:50]}")
                 return True
+
+            # Show typing indicator, but only if handling turns out to be slow
+            typing_task = asyncio.create_task(self._send_typing_after(TYPING_INDICATOR_DELAY))
+
             # Get user categories for better parsing context
             categories = await self.category_service.get_user_categories(
                 self.user.user_id
             )
 
-            # Show typing indicator
-            await self.message.bot.send_chat_action(
-                self.message.chat.id,
-                "typing"
-            )
-
             # Parse the input
             try:
-                parse_result = await expense_parser.parse(text, self.user.id, categories)
+                parse_result = expense_parser.parse(text, categories)
             except Exception as e:
                 logger.exception(f"Parsing failed for input '{text}': {e}")
                 await self.message.answer(
@@ -120,6 +121,17 @@ class ExpenseHandler:
                 parse_mode="HTML"
             )
             return True
+        finally:
+            if typing_task:
+                typing_task.cancel()
+
+    async def _send_typing_after(self, delay: float):
+        """Send the typing action once `delay` seconds have passed"""
+        await asyncio.sleep(delay)
+        try:
+            await self.message.bot.send_chat_action(self.message.chat.id, "typing")
+        except Exception as e:
+            logger.debug(f"Could not send typing action: {e}")
 
     async def _handle_multiple_expenses(self, parse_result: Dict[str, Any]):
         """
@@ -185,31 +197,46 @@ class ExpenseHandler:
         total_amount = 0
         budget_warnings = []
 
-        for txn_data in auto_create:
+        if auto_create:
             try:
-                await self.transaction_service.create_transaction(
-                    user_id=self.user.user_id,
-                    amount=txn_data['amount'],
-                    category_id=txn_data['category'].id,
-                    transaction_type=txn_data['type'],
-                    description=txn_data['description'],
-                    payment_method='cash'
-                )
-                created_count += 1
+                await self.transaction_service.create_transactions([
+                    {
+                        'user_id': self.user.user_id,
+                        'amount': txn_data['amount'],
+                        'category_id': txn_data['category'].id,
+                        'transaction_type': txn_data['type'],
+                        'description': txn_data['description'],
+                        'payment_method': 'cash',
+                    }
+                    for txn_data in auto_create
+                ])
+                created_count = len(auto_create)
+            except Exception as e:
+                logger.error(f"Failed to create transactions: {e}")
+
+        if created_count:
+            checked_categories = {}
+            for txn_data in auto_create:
                 if txn_data['type'] != 'income':
                     total_amount += txn_data['amount']
+                checked_categories.setdefault(txn_data['category'].id, txn_data)
 
-                # Check budget
-                budget_info = await self._get_budget_info(
-                    txn_data['category'].id,
-                    txn_data['amount']
+            # Check budgets of every touched category in one query
+            try:
+                budget_statuses = await self.budget_service.get_budget_statuses(
+                    self.user.user_id,
+                    checked_categories
                 )
+            except Exception as e:
+                logger.error(f"Error getting budget info: {e}")
+                budget_statuses = {}
+
+            for category_id, txn_data in checked_categories.items():
+                budget_info = self._format_budget_info(budget_statuses.get(category_id))
                 if budget_info and ('exceeded' in budget_info or 'warning' in budget_info):
                     budget_warnings.append(
                         f"• {txn_data['category'].name}: {budget_info}"
                     )
-            except Exception as e:
-                logger.error(f"Failed to create transaction: {e}")
 
         # Build response message
         response = ""
@@ -343,7 +370,7 @@ class ExpenseHandler:
     async def _create_expense_transaction(
             self,
             amount: float,
-            category: Category,
+            category: CategoryInfo,
             description: str,
             confidence: float
     ):
@@ -387,7 +414,7 @@ class ExpenseHandler:
     async def _create_income_transaction(
             self,
             amount: float,
-            category: Category,
+            category: CategoryInfo,
             description: str
     ):
         """Create income transaction and show result"""
@@ -495,37 +522,41 @@ class ExpenseHandler:
                 self.user.user_id,
                 category_id
             )
-
-            if not budget_status:
-                return None
-
-            percentage = budget_status['percentage']
-            spent = budget_status['spent']
-            budget_amount = budget_status['budget'].amount
-
-            if budget_status['is_exceeded']:
-                return (
-                    f"⚠️ <b>Budget exceeded!</b>\n"
-                    f"Spent: {format_amount(spent, self.user.currency)} / "
-                    f"{format_amount(budget_amount, self.user.currency)} "
-                    f"({percentage}%)"
-                )
-            elif budget_status['is_warning']:
-                return (
-                    f"⚡ <b>Budget warning: {percentage}%</b>\n"
-                    f"Spent: {format_amount(spent, self.user.currency)} / "
-                    f"{format_amount(budget_amount, self.user.currency)}"
-                )
-            else:
-                return (
-                    f"✅ Budget: {format_amount(spent, self.user.currency)} / "
-                    f"{format_amount(budget_amount, self.user.currency)} "
-                    f"({percentage}%)"
-                )
         except Exception as e:
             logger.error(f"Error getting budget info: {e}")
             return None
 
+        return self._format_budget_info(budget_status)
+
+    def _format_budget_info(self, budget_status: Optional[Dict]) -> Optional[str]:
+        """Render a budget status for the confirmation message"""
+        if not budget_status:
+            return None
+
+        percentage = budget_status['percentage']
+        spent = budget_status['spent']
+        budget_amount = budget_status['budget'].amount
+
+        if budget_status['is_exceeded']:
+            return (
+                f"⚠️ <b>Budget exceeded!</b>\n"
+                f"Spent: {format_amount(spent, self.user.currency)} / "
+                f"{format_amount(budget_amount, self.user.currency)} "
+                f"({percentage}%)"
+            )
+        elif budget_status['is_warning']:
+            return (
+                f"⚡ <b>Budget warning: {percentage}%</b>\n"
+                f"Spent: {format_amount(spent, self.user.currency)} / "
+                f"{format_amount(budget_amount, self.user.currency)}"
+            )
+        else:
+            return (
+                f"✅ Budget: {format_amount(spent, self.user.currency)} / "
+                f"{format_amount(budget_amount, self.user.currency)} "
+                f"({percentage}%)"
+            )
+
     @staticmethod
     def _get_confidence_indicator(confidence: float) -> str:
         """Get confidence indicator emoji"""
@@ -801,7 +832,7 @@ async def cmd_today(message: Message, session: AsyncSession):
     user = await User.get_or_create(user_id=message.from_user.id, username=message.from_user.username)
     user = user[0]
 
-    transactions = await get_transactions_today(user_id=user.user_id)
+    transactions = await get_transactions_today_lite(session, user.user_id)
 
     if not transactions:
         await message.answer(_("📊 No expenses recorded today."))
@@ -816,10 +847,10 @@ async def cmd_today(message: Message, session: AsyncSession):
     # Group by category
     by_category = {}
     for t in transactions:
-        cat_name = t.category.name
+        cat_name = t.category_name
         if cat_name not in by_category:
             by_category[cat_name] = {
-                'emoji': t.category.icon_emoji,
+                'emoji': t.category_emoji,
                 'amount': 0,
                 'count': 0
             }
@@ -833,7 +864,7 @@ async def cmd_today(message: Message, session: AsyncSession):
 
     response += f"\n<b>{_('Recent transactions')}:</b>\n"
     for t in transactions[-5:]:
-        response += f"• {t.category.icon_emoji} {format_amount(t.amount, user.currency)}"
+        response += f"• {t.category_emoji} {format_amount(t.amount, user.currency)}"
         if t.description:
             response += f" - {t.description}"
         response += "\n"
@@ -848,7 +879,7 @@ async def cmd_recent(message: Message, session: AsyncSession):
     """Show recent transactions"""
     user = await User.get(id_=message.from_user.id)
 
-    transactions = await get_recent_transactions(session, user.user_id, limit=10)
+    transactions = await get_recent_transactions_lite(session, user.user_id, limit=10)
 
     if not transactions:
         await message.answer(_("📊 No transactions yet. Start by logging your first expense!"))
@@ -861,8 +892,8 @@ async def cmd_recent(message: Message, session: AsyncSession):
         date_str = local_time.strftime("%d %b, %H:%M")
         type_emoji = "💸" if t.type == "expense" else "💰"
 
-        response += f"{type_emoji} {t.category.icon_emoji} <b>{format_amount(t.amount, user.currency)}</b>\n"
-        response += f"   {t.category.name}"
+        response += f"{type_emoji} {t.category_emoji} <b>{format_amount(t.amount, user.currency)}</b>\n"
+        response += f"   {t.category_name}"
         if t.description:
             response += f" • {t.description}"
         response += f"\n   <i>{date_str}</i>\n\n"
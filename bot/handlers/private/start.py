@@ -1,7 +1,7 @@
 """
 Start command and main menu handlers
 """
-from datetime import datetime
+from datetime import datetime, timezone
 
 from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.database import User
 from bot.services.user_service import user_service
-from bot.utils.helpers import get_monthly_summary
+from bot.utils.helpers import get_user_with_monthly_stats
 
 from loguru import logger
 
@@ -102,18 +102,21 @@ async def cmd_about(message: Message, session: AsyncSession):
     """Show bot information and user stats"""
 
     async with measure("about_handler"):
-        user, created = await User.get_or_create(
-            user_id=message.from_user.id
-        )
-
-        # Get user statistics
-        current_month = datetime.now()
-        monthly_summary = await get_monthly_summary(
+        # User row and monthly stats come back in a single round trip
+        current_month = datetime.now(timezone.utc)
+        stats = await get_user_with_monthly_stats(
             session,
-            user.user_id,
+            message.from_user.id,
             current_month.year,
             current_month.month
         )
+        if stats is None:
+            user, created = await User.get_or_create(
+                user_id=message.from_user.id
+            )
+            monthly_transactions, total_spent = 0, 0.0
+        else:
+            user, monthly_transactions, total_spent = stats
 
         await message.answer(_(
             "ℹ️ <b>About Finance Tracker Bot</b>\n\n"
@@ -137,8 +140,8 @@ async def cmd_about(message: Message, session: AsyncSession):
             "Made with ❤️\n"
             "Version: 1.0.0"
         ).format(joined_date=user.created_at.strftime('%d %b %Y'), currency=user.currency,
-                 monthly_transactions=monthly_summary['transaction_count'],
-                 total_spent=monthly_summary['total_expenses']), parse_mode="HTML")
+                 monthly_transactions=monthly_transactions,
+                 total_spent=total_spent), parse_mode="HTML")
 
 
 @start_router.message(Command("feedback"))
@@ -1,13 +1,28 @@
+from functools import lru_cache
+
 import pytz
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
-from aiogram.utils.i18n import gettext as _
+from aiogram.utils.i18n import gettext as _, get_i18n
 from loguru import logger
 
 from bot.utils.helpers import format_timezone
 
-
+_CURRENCIES: tuple[tuple[str, str, str], ...] = (
+    ("UZS", "🇺🇿 UZS - So'm", "curr_UZS"),
+    ("USD", "🇺🇸 USD - Dollar", "curr_USD"),
+    ("EUR", "🇪🇺 EUR - Euro", "curr_EUR"),
+    ("RUB", "🇷🇺 RUB - Ruble", "curr_RUB"),
+    ("GBP", "🇬🇧 GBP - Pound", "curr_GBP"),
+    ("JPY", "🇯🇵 JPY - Yen", "curr_JPY"),
+    ("CNY", "🇨🇳 CNY - Yuan", "curr_CNY"),
+    ("KZT", "🇰🇿 KZT - Tenge", "curr_KZT"),
+    ("TRY", "🇹🇷 TRY - Lira", "curr_TRY"),
+)
+
+@lru_cache(maxsize=1)
 def currency_choice_ikm() -> InlineKeyboardMarkup:
+    # Telegram types are frozen models, so the static markup is built once and shared
     ikb = InlineKeyboardBuilder()
 
     ikb.row(
@@ -41,25 +56,12 @@ def get_category_keyboard(categories) -> InlineKeyboardMarkup:
 
 def get_currency_keyboard(current: str = None) -> InlineKeyboardMarkup:
     """Create currency selection keyboard with more options"""
-    currencies = [
-        ("🇺🇿 UZS - So'm", "curr_UZS"),
-        ("🇺🇸 USD - Dollar", "curr_USD"),
-        ("🇪🇺 EUR - Euro", "curr_EUR"),
-        ("🇷🇺 RUB - Ruble", "curr_RUB"),
-        ("🇬🇧 GBP - Pound", "curr_GBP"),
-        ("🇯🇵 JPY - Yen", "curr_JPY"),
-        ("🇨🇳 CNY - Yuan", "curr_CNY"),
-        ("🇰🇿 KZT - Tenge", "curr_KZT"),
-        ("🇹🇷 TRY - Lira", "curr_TRY"),
+    # Add checkmark for current currency
+    buttons = [
+        [InlineKeyboardButton(text=f"✅ {name}" if code == current else name, callback_data=callback)]
+        for code, name, callback in _CURRENCIES
     ]
 
-    buttons = []
-    for name, callback in currencies:
-        # Add checkmark for current currency
-        if current and callback.endswith(current):
-            name = f"✅ {name}"
-        buttons.append([InlineKeyboardButton(text=name, callback_data=callback)])
-
     # Add back button
     buttons.append([InlineKeyboardButton(text="« Back", callback_data="settings_main")])
 
@@ -88,6 +90,12 @@ def get_language_keyboard(current: str = None) -> InlineKeyboardMarkup:
 
 def get_settings_keyboard() -> InlineKeyboardMarkup:
     """Create settings menu keyboard"""
+    return _settings_keyboard(get_i18n().current_locale)
+
+
+@lru_cache(maxsize=8)
+def _settings_keyboard(locale: str) -> InlineKeyboardMarkup:
+    # Only the translated labels vary, so one markup is kept per locale
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
         [
             InlineKeyboardButton(text=_("🌍 Language"), callback_data="settings_language"),
@@ -2,17 +2,16 @@ from typing import Dict, Any, Awaitable, Callable
 
 from aiogram import Dispatcher, BaseMiddleware
 from aiogram.types import TelegramObject
-from aiogram.utils.i18n import I18n
 
 from bot.database.engine import db
 from bot.middlewares.database import DatabaseMiddleware
 from bot.middlewares.maintenance import MaintenanceMiddleware
 from bot.middlewares.throttling import ThrottlingMiddleware
-from .i18n import CustomI18nMiddleware
+from .i18n import CustomI18nMiddleware, CachedI18n
 from .user import UserMiddleware
 from ..services.user_service import user_service
 
-i18n = I18n(path="bot/locales", default_locale="en", domain="messages")
+i18n = CachedI18n(path="bot/locales", default_locale="en", domain="messages")
 
 
 class ServiceInjectionMiddleware(BaseMiddleware):
@@ -35,7 +34,11 @@ def register_middleware(dp: Dispatcher):
 
     dp.update.middleware(ServiceInjectionMiddleware())
 
-    dp.update.middleware(DatabaseMiddleware(db.get_sessionmaker))
+    # The session factory only exists after init_database(), so resolve it per update.
+    # Only message and callback handlers use a session, so other updates don't check one out.
+    database_middleware = DatabaseMiddleware(lambda: db.get_sessionmaker())
+    dp.message.middleware(database_middleware)
+    dp.callback_query.middleware(database_middleware)
 
     dp.message.middleware(UserMiddleware())
     dp.callback_query.middleware(UserMiddleware())
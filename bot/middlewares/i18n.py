@@ -1,11 +1,43 @@
+from contextlib import contextmanager
+from functools import lru_cache
+
 from aiogram.utils.i18n import I18n
 from aiogram.utils.i18n.middleware import I18nMiddleware
 from aiogram.types import TelegramObject
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Generator, Optional
 
 from bot.utils.perf import measure
 
 
+class CachedI18n(I18n):
+    """I18n that memoizes translated strings per (locale, msgid, plural, n)"""
+
+    def __init__(self, *args: Any, cache_size: int = 4096, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._translate = lru_cache(maxsize=cache_size)(self._translate_uncached)
+
+    def _translate_uncached(self, locale: str, singular: str, plural: Optional[str], n: int) -> str:
+        return super().gettext(singular, plural, n, locale)
+
+    def gettext(self, singular: str, plural: Optional[str] = None, n: int = 1, locale: Optional[str] = None) -> str:
+        if locale is None:
+            locale = self.current_locale
+        return self._translate(locale, singular, plural, n)
+
+    def reload(self) -> None:
+        super().reload()
+        self._translate.cache_clear()
+
+    @contextmanager
+    def context(self) -> Generator[I18n, None, None]:
+        # The context var is per class; gettext helpers look it up on I18n
+        token = I18n.set_current(self)
+        try:
+            yield self
+        finally:
+            I18n.reset_current(token)
+
+
 class CustomI18nMiddleware(I18nMiddleware):
     def __init__(self, i18n: I18n, i18n_key: Optional[str] = "i18n", middleware_key: str = "i18n_middleware") -> None:
         super().__init__(i18n, i18n_key, middleware_key)
@@ -18,6 +50,11 @@ class CustomI18nMiddleware(I18nMiddleware):
                 return self.default_locale or "en"
 
             user_service = data["user_service"]
+            # UserMiddleware has normally cached the user already
+            language = user_service.get_cached_language(user.id)
+            if language is not None:
+                return language
+
             telegram_fallback = user.language_code or "en"
 
             return await user_service.get_user_language(
@@ -5,7 +5,40 @@ from loguru import logger
 
 from bot.core.config import settings
 
-ADMIN_IDS = settings.ADMIN_IDS
+ADMIN_IDS = frozenset(settings.ADMIN_IDS)
+MAINTENANCE_MESSAGE = settings.MAINTENANCE_MESSAGE
+
+
+def _from_message(event: Message):
+    return event.from_user, event.chat.id
+
+
+def _from_callback_query(event: CallbackQuery):
+    chat_id = event.message.chat.id if event.message and event.message.chat else event.from_user.id
+    return event.from_user, chat_id
+
+
+def _from_update(event: Update):
+    if event.message:
+        return _from_message(event.message)
+    if event.callback_query:
+        return _from_callback_query(event.callback_query)
+    return None
+
+
+def _from_unknown(event: TelegramObject):
+    msg = getattr(event, "message", None)
+    if not msg:
+        return None
+    return getattr(msg, "from_user", None), getattr(msg, "chat", None) and getattr(msg.chat, "id", None)
+
+
+# Exact-type lookup replaces the isinstance ladder; unknown shapes fall back to attribute probing
+_EXTRACTORS = {
+    Message: _from_message,
+    CallbackQuery: _from_callback_query,
+    Update: _from_update,
+}
 
 
 class MaintenanceMiddleware(BaseMiddleware):
@@ -20,38 +53,15 @@ class MaintenanceMiddleware(BaseMiddleware):
         maintenance_mode = settings.MAINTENANCE_MODE
         if not maintenance_mode:
             return await handler(event, data)
-        # Log maintenance mode access attempt
-        user = None
-        if isinstance(event, Message):
-            user = event.from_user
-            chat_id = event.chat.id
-        elif isinstance(event, CallbackQuery):
-            user = event.from_user
-            chat_id = event.message.chat.id if event.message else event.from_user.id
-        else:
-            try:
-                if isinstance(event, Update):
-                    if event.message:
-                        user = event.message.from_user
-                        chat_id = event.message.chat.id
-                    elif event.callback_query:
-                        cq = event.callback_query
-                        user = cq.from_user
-                        chat_id = cq.message.chat.id if cq.message and cq.message.chat else user.id
-                    else:
-                        # logger.info(f"MaintenanceMiddleware: Update event with unsupported inner type: {event}")
-                        return await handler(event, data)
-                else:
-                    if hasattr(event, "message") and getattr(event, "message"):
-                        msg = getattr(event, "message")
-                        user = getattr(msg, "from_user", None)
-                        chat_id = getattr(msg, "chat", None) and getattr(msg.chat, "id", None)
-                    else:
-                        # logger.info(f"MaintenanceMiddleware: Unknown event shape: {type(event)}")
-                        return await handler(event, data)
-            except Exception as exc:
-                logger.exception(f"Error while normalizing event in MaintenanceMiddleware: {exc}")
-                return await handler(event, data)
+        try:
+            target = _EXTRACTORS.get(type(event), _from_unknown)(event)
+        except Exception as exc:
+            logger.exception(f"Error while normalizing event in MaintenanceMiddleware: {exc}")
+            return await handler(event, data)
+
+        if target is None or target[0] is None:
+            return await handler(event, data)
+        user, chat_id = target
 
         # Allow admins to bypass maintenance mode
         if user.id in ADMIN_IDS:
@@ -68,7 +78,7 @@ class MaintenanceMiddleware(BaseMiddleware):
             try:
                 await bot.send_message(
                     chat_id=chat_id,
-                    text=settings.MAINTENANCE_MESSAGE,
+                    text=MAINTENANCE_MESSAGE,
                     parse_mode="HTML"
                 )
             except Exception as e:
@@ -1,16 +1,32 @@
+import time
+
 from aiogram import BaseMiddleware
-from cachetools import TTLCache
 
 from bot.core.config import settings
 
+ADMIN_IDS = frozenset(settings.ADMIN_IDS)
+
+
+class ThrottleState:
+    """Per-user counter for the current window plus the warning cooldown"""
+
+    __slots__ = ("window", "count", "warned_until")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.count = 0
+        self.warned_until = 0.0
+
 
 class ThrottlingMiddleware(BaseMiddleware):
     """Rate limit users to prevent spam/abuse"""
 
-    def __init__(self, rate_limit: int = 30):
-        self.cache = TTLCache(maxsize=10000, ttl=60)
+    def __init__(self, rate_limit: int = 30, window: int = 60, warn_cooldown: int = 300):
         self.rate_limit = rate_limit
-        self.warned_users = TTLCache(maxsize=1000, ttl=300)
+        self.window = window
+        self.warn_cooldown = warn_cooldown
+        self.states: dict[int, ThrottleState] = {}
+        self._current_window = 0
 
     async def __call__(self, handler, event, data):
         if not hasattr(event, 'from_user'):
@@ -18,16 +34,28 @@ class ThrottlingMiddleware(BaseMiddleware):
 
         user_id = event.from_user.id
 
-        if user_id in settings.ADMIN_IDS:
+        if user_id in ADMIN_IDS:
             return await handler(event, data)
 
-        # Check rate limit
-        count = self.cache.get(user_id, 0)
+        now = time.monotonic()
+        current_window = int(now) // self.window
+        if current_window != self._current_window:
+            # Only users still inside a warning cooldown need to outlive a window
+            self._current_window = current_window
+            self.states = {uid: state for uid, state in self.states.items() if state.warned_until > now}
 
-        if count >= self.rate_limit:
+        state = self.states.get(user_id)
+        if state is None:
+            state = self.states[user_id] = ThrottleState(current_window)
+        elif state.window != current_window:
+            state.window = current_window
+            state.count = 0
+
+        # Check rate limit
+        if state.count >= self.rate_limit:
             # Only warn once per cooldown period
-            if user_id not in self.warned_users:
-                self.warned_users[user_id] = True
+            if now >= state.warned_until:
+                state.warned_until = now + self.warn_cooldown
                 bot = data.get('bot')
                 if bot and hasattr(event, 'chat'):
                     await bot.send_message(
@@ -38,5 +66,5 @@ class ThrottlingMiddleware(BaseMiddleware):
                     )
             return None
 
-        self.cache[user_id] = count + 1
+        state.count += 1
         return await handler(event, data)
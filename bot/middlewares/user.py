@@ -17,8 +17,9 @@ class UserMiddleware(BaseMiddleware):
     ) -> Any:
         async with measure("user_middleware"):
             user = data.get("event_from_user")
-            if user:
-                user_service = data["user_service"]
+            user_service = data["user_service"]
+            # Known users skip the coroutine entirely
+            if user and not user_service.is_cached(user.id):
                 await user_service.ensure_user_exists(
                     user=user,
                 )
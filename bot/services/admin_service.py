@@ -1,15 +1,26 @@
 import asyncio
-from datetime import datetime
-from typing import Dict, Optional, List
+from collections import Counter
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Optional, List
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramForbiddenError, TelegramBadRequest
+from aiolimiter import AsyncLimiter
 from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.database import Transaction, User
 
+# Telegram allows about 30 messages per second to different chats
+BROADCAST_RATE_LIMIT = 20
+BROADCAST_CONCURRENCY = 20
+BROADCAST_FETCH_SIZE = 1000
+
+# One bucket per process, so overlapping broadcasts share the limit instead of
+# each getting its own
+broadcast_limiter = AsyncLimiter(BROADCAST_RATE_LIMIT, 1)
+
 
 class BroadcastService:
     """Service for broadcasting messages to users"""
@@ -18,71 +29,83 @@ class BroadcastService:
         self.bot = bot
         self.session = session
 
-    async def send_broadcast(
-            self,
-            text: str,
-            parse_mode: str = "HTML",
-            disable_notification: bool = False,
-            exclude_user_ids: Optional[List[int]] = None
-    ) -> Dict[str, int]:
-        """
-        Send broadcast message to all users
-
-        Returns:
-            Dict with success, failed, and blocked counts
-        """
-        result = await User.get_all()
-        user_ids = [row.user_id for row in result]
-
-        if exclude_user_ids:
-            user_ids = [uid for uid in user_ids if uid not in exclude_user_ids]
-
-        logger.info(f"Starting broadcast to {len(user_ids)} users")
-
-        success = 0
-        failed = 0
-        blocked = 0
-
-        # Send with rate limiting (20 messages per second for Telegram)
-        for i, user_id in enumerate(user_ids, 1):
+    async def _deliver(self, user_id: int, text: str, **kwargs) -> str:
+        """Send one message under the shared rate limit and return its outcome"""
+        async with broadcast_limiter:
             try:
-                await self.bot.send_message(
-                    chat_id=user_id,
-                    text=text,
-                    parse_mode=parse_mode,
-                    disable_notification=disable_notification
-                )
-                success += 1
-
-                # Log progress every 100 messages
-                if i % 100 == 0:
-                    logger.info(f"Broadcast progress: {i}/{len(user_ids)}")
-
-                # Rate limiting: 20 messages per second
-                if i % 20 == 0:
-                    await asyncio.sleep(1)
+                await self.bot.send_message(chat_id=user_id, text=text, **kwargs)
+                return 'success'
 
             except TelegramForbiddenError:
                 # User blocked the bot
-                blocked += 1
                 logger.debug(f"User {user_id} has blocked the bot")
+                return 'blocked'
 
             except TelegramBadRequest as e:
                 # Invalid user or other error
-                failed += 1
                 logger.warning(f"Failed to send to {user_id}: {e}")
+                return 'failed'
 
             except Exception as e:
-                failed += 1
                 logger.error(f"Unexpected error sending to {user_id}: {e}")
+                return 'failed'
+
+    async def _deliver_all(self, user_ids: AsyncIterator[int], text: str, **kwargs) -> Dict[str, int]:
+        """Deliver to a stream of user ids, keeping a bounded number of sends in flight"""
+        outcomes = Counter()
+        pending = set()
+
+        def collect(done) -> None:
+            for task in done:
+                outcomes[task.result()] += 1
+                # Log progress every 100 messages
+                if outcomes.total() % 100 == 0:
+                    logger.info(f"Broadcast progress: {outcomes.total()} sent")
 
-        result = {
-            'success': success,
-            'failed': failed,
-            'blocked': blocked,
-            'total': len(user_ids)
+        async for user_id in user_ids:
+            if len(pending) >= BROADCAST_CONCURRENCY:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+            pending.add(asyncio.create_task(self._deliver(user_id, text, **kwargs)))
+
+        if pending:
+            done, _ = await asyncio.wait(pending)
+            collect(done)
+
+        return {
+            'success': outcomes['success'],
+            'failed': outcomes['failed'],
+            'blocked': outcomes['blocked'],
+            'total': outcomes.total()
         }
 
+    async def send_broadcast(
+            self,
+            text: str,
+            parse_mode: str = "HTML",
+            disable_notification: bool = False,
+            exclude_user_ids: Optional[List[int]] = None
+    ) -> Dict[str, int]:
+        """
+        Send broadcast message to all users
+
+        Returns:
+            Dict with success, failed, and blocked counts
+        """
+        excluded = set(exclude_user_ids or ())
+        logger.info(f"Starting broadcast to all users ({len(excluded)} excluded)")
+
+        # Rows are pulled from the cursor as sends complete instead of loading every id first
+        user_ids = await self.session.stream_scalars(
+            select(User.user_id).execution_options(yield_per=BROADCAST_FETCH_SIZE)
+        )
+        result = await self._deliver_all(
+            (user_id async for user_id in user_ids if user_id not in excluded),
+            text,
+            parse_mode=parse_mode,
+            disable_notification=disable_notification
+        )
+
         logger.info(f"Broadcast completed: {result}")
         return result
 
@@ -96,41 +119,16 @@ class BroadcastService:
         Send message only to users active in last N days
         """
         from datetime import timedelta
-        cutoff = datetime.now() - timedelta(days=days)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-        # Get active user IDs
-        result = await self.session.execute(
+        # Active user ids are streamed in batches and fed to the sender as they arrive
+        user_ids = await self.session.stream_scalars(
             select(User.user_id)
             .join(Transaction, Transaction.user_id == User.user_id)
             .where(Transaction.created_at >= cutoff)
             .distinct()
+            .execution_options(yield_per=BROADCAST_FETCH_SIZE)
         )
-        user_ids = [row[0] for row in result]
-
-        logger.info(f"Sending to {len(user_ids)} active users (last {days} days)")
-
-        success = 0
-        failed = 0
-        blocked = 0
 
-        for user_id in user_ids:
-            try:
-                await self.bot.send_message(
-                    chat_id=user_id,
-                    text=text,
-                    parse_mode=parse_mode
-                )
-                success += 1
-                await asyncio.sleep(0.05)  # Rate limiting
-
-            except (TelegramForbiddenError, TelegramBadRequest):
-                blocked += 1
-            except Exception:
-                failed += 1
-
-        return {
-            'success': success,
-            'failed': failed,
-            'blocked': blocked,
-            'total': len(user_ids)
-        }
\ No newline at end of file
+        logger.info(f"Sending to active users (last {days} days)")
+        return await self._deliver_all(user_ids, text, parse_mode=parse_mode)
@@ -1,5 +1,6 @@
-from typing import Optional, Dict
-from sqlalchemy import select, func
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Iterable
+from sqlalchemy import and_, case, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from bot.database.models import Budget, Transaction
 
@@ -14,37 +15,46 @@ class BudgetService:
             category_id: int
     ) -> Optional[Dict]:
         """Get budget status for a category"""
-        # Get budget
-        result = await self.session.execute(
-            select(Budget).where(
-                Budget.user_id == user_id,
-                Budget.category_id == category_id
-            )
-        )
-        budget = result.scalar_one_or_none()
-
-        if not budget:
-            return None
-
-        spent = await self._calculate_spent(user_id, category_id)
+        statuses = await self.get_budget_statuses(user_id, (category_id,))
+        return statuses.get(category_id)
 
-        percentage = (spent / budget.amount * 100) if budget.amount > 0 else 0
-
-        return {
-            'budget': budget,
-            'spent': spent,
-            'percentage': round(percentage, 1),
-            'is_exceeded': spent > budget.amount,
-            'is_warning': budget.amount * 0.8 < spent <= budget.amount
-        }
+    async def get_budget_statuses(
+            self,
+            user_id: int,
+            category_ids: Iterable[int]
+    ) -> Dict[int, Dict]:
+        """Get budget status for several categories, keyed by category id"""
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        period_start = case(
+            (Budget.period == 'monthly', today.replace(day=1)),
+            (Budget.period == 'weekly', today - timedelta(days=today.weekday())),
+            else_=today
+        )
 
-    async def _calculate_spent(self, user_id: int, category_id: int) -> float:
-        """Calculate total spent in current period"""
+        # Every budget with its spent amount for the current period in one round trip
         result = await self.session.execute(
-            select(func.sum(Transaction.amount)).where(
-                Transaction.user_id == user_id,
-                Transaction.category_id == category_id,
-                Transaction.type == 'expense'
+            select(Budget, func.coalesce(func.sum(Transaction.amount), 0.0))
+            .outerjoin(Transaction, and_(
+                Transaction.user_id == Budget.user_id,
+                Transaction.category_id == Budget.category_id,
+                Transaction.type == 'expense',
+                Transaction.date >= period_start
+            ))
+            .where(
+                Budget.user_id == user_id,
+                Budget.category_id.in_(list(category_ids))
             )
+            .group_by(Budget.id)
         )
-        return result.scalar() or 0.0
\ No newline at end of file
+
+        statuses = {}
+        for budget, spent in result:
+            percentage = (spent / budget.amount * 100) if budget.amount > 0 else 0
+            statuses[budget.category_id] = {
+                'budget': budget,
+                'spent': spent,
+                'percentage': round(percentage, 1),
+                'is_exceeded': spent > budget.amount,
+                'is_warning': budget.amount * 0.8 < spent <= budget.amount
+            }
+        return statuses
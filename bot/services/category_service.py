@@ -1,9 +1,50 @@
-from typing import Optional, Sequence
+from typing import NamedTuple, Optional, Tuple
+from cachetools import TTLCache
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from bot.database.models import Category
 
 
+class CategoryInfo(NamedTuple):
+    """Immutable snapshot of a category, safe to share across sessions and tasks"""
+    id: int
+    name: str
+    type: str
+    icon_emoji: str
+
+
+# Shared across handlers: categories are read on every message but only
+# change on signup or when a category is created. Keyed on (user_id, type)
+user_categories_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+
+def invalidate_user_categories(user_id: int) -> None:
+    """Forget cached categories of a user, for every type filter"""
+    for category_type in (None, "expense", "income"):
+        user_categories_cache.pop((user_id, category_type), None)
+
+
+async def load_user_categories(
+        session: AsyncSession,
+        user_id: int,
+        category_type: Optional[str] = None
+) -> Tuple[CategoryInfo, ...]:
+    """Get a user's categories as plain rows, from the cache when possible"""
+    key = (user_id, category_type or None)
+    cached = user_categories_cache.get(key)
+    if cached is not None:
+        return cached
+
+    query = select(Category.id, Category.name, Category.type, Category.icon_emoji).where(
+        Category.user_id == user_id
+    )
+    if category_type:
+        query = query.where(Category.type == category_type)
+    result = await session.execute(query)
+    categories = user_categories_cache[key] = tuple(CategoryInfo._make(row) for row in result)
+    return categories
+
+
 class CategoryService:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -12,26 +53,19 @@ class CategoryService:
             self,
             user_id: int,
             category_type: Optional[str] = None
-    ) -> Sequence[Category]:
+    ) -> Tuple[CategoryInfo, ...]:
         """Get all categories for a user"""
-        query = select(Category).where(Category.user_id == user_id)
-        if category_type:
-            query = query.where(Category.type == category_type)
-        result = await self.session.execute(query)
-        return result.scalars().all()
+        return await load_user_categories(self.session, user_id, category_type)
 
     async def get_category_by_name(
             self,
             user_id: int,
             name: str,
             category_type: Optional[str] = None
-    ) -> Optional[Category]:
+    ) -> Optional[CategoryInfo]:
         """Find category by name (case-insensitive)"""
-        query = select(Category).where(
-            Category.user_id == user_id,
-            Category.name.ilike(name)
-        )
-        if category_type:
-            query = query.where(Category.type == category_type)
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        # The user's (cached) categories are the full candidate set, so a
+        # lowercase lookup replaces an ILIKE round trip per parsed entry
+        categories = await self.get_user_categories(user_id, category_type)
+        by_lower = {category.name.lower(): category for category in categories}
+        return by_lower.get(name.lower())
@@ -2,8 +2,24 @@
 Refined expense parser with better accuracy, multi-expense support, and income detection
 """
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Dict, Optional, List, Tuple, Sequence
 
+import ahocorasick
+
+# Keyword roles stored in the automaton, sorted so that hits come back in declaration order
+_CATEGORY, _INCOME, _EXPENSE = 0, 1, 2
+_PRIMARY, _SECONDARY = 0, 1
+_STRONG, _WEAK = 0, 1
+
+# Short words that are not counted as suspicious when deciding on AI fallback
+_COMMON_SHORT_WORDS = frozenset(('i', 'on', 'at', 'to', 'k'))
+
+# Category score tiers: a score of at least _CATEGORY_SCORE_TIERS[i] gets _CATEGORY_TIER_CONFIDENCE[i + 1]
+_CATEGORY_SCORE_TIERS = (1.0, 1.5, 2.0, 3.0)
+_CATEGORY_TIER_CONFIDENCE = (0.45, 0.65, 0.75, 0.85, 0.95)
+
 class ExpenseParser:
     """
     Intelligent expense parser with:
@@ -15,12 +31,12 @@ class ExpenseParser:
     def __init__(self,):
         # Compile regex patterns once for performance
         self.amount_pattern = re.compile(
-            r'(?:^|\s|,)(\d+(?:[.,]\d+)?)\s*(?:k|к|thousand|тысяч|т|thous)?(?:\s|,|$)',
+            r'(?:^|\s|,)(?P<int>\d+)(?:[.,](?P<frac>\d+))?\s*(?P<mul>k|к|thousand|тысяч|т|thous)?(?:\s|,|$)',
             re.IGNORECASE
         )
 
         # Currency symbols (for dollar signs, etc.)
-        self.currency_pattern = re.compile(r'[$€£₽]\s*(\d+(?:[.,]\d+)?)')
+        self.currency_pattern = re.compile(r'[$€£₽]\s*(?P<int>\d+)(?:[.,](?P<frac>\d+))?')
 
         # More strict category keywords with primary/secondary separation
         self.category_keywords = {
@@ -83,10 +99,93 @@ class ExpenseParser:
             'weak': ['for', 'on']
         }
 
-    async def parse(
+        self._category_names = list(self.category_keywords)
+        self._automaton = self._build_automaton()
+
+        # Words stripped from descriptions. Each is a single \w+ token, so matching
+        # whole tokens against a set is equivalent to a \b-bounded alternation
+        self._description_strip_words = frozenset(
+            keyword.lower()
+            for data in self.category_keywords.values()
+            for keyword in data['primary'] + data.get('secondary', [])
+            if len(keyword) > 3  # Skip short words
+        ) | frozenset(w.lower() for w in self.expense_indicators['strong'] + self.expense_indicators['weak'])
+        self._word_re = re.compile(r'\w+')
+        self._whitespace_re = re.compile(r'\s+')
+        self._leading_preposition_re = re.compile(r'^(for|on|at|in)\s+', re.IGNORECASE)
+
+        # Users re-send the same short messages; memoize the rule pipeline per (text, category names)
+        self._rules_cached = lru_cache(maxsize=4096)(self._apply_rules)
+        # One matcher per distinct set of user category names, built on first use
+        self._user_category_matcher = lru_cache(maxsize=1024)(self._build_user_category_matcher)
+
+    def _build_automaton(self) -> ahocorasick.Automaton:
+        """
+        Aho-Corasick automaton over every category keyword and type indicator
+
+        One pass over the text finds all substring hits that the keyword
+        loops used to search for one by one. Each keyword maps to the list
+        of roles it plays (a word like 'bought' is both a shopping keyword
+        and an expense indicator).
+        """
+        roles: Dict[str, List[Tuple]] = {}
+
+        for index, data in enumerate(self.category_keywords.values()):
+            for part, keywords in ((_PRIMARY, data['primary']), (_SECONDARY, data.get('secondary', []))):
+                for position, keyword in enumerate(keywords):
+                    roles.setdefault(keyword, []).append((_CATEGORY, index, part, position, keyword))
+
+        for group, indicators in ((_INCOME, self.income_indicators), (_EXPENSE, self.expense_indicators)):
+            for strength, keywords in ((_STRONG, indicators['strong']), (_WEAK, indicators['weak'])):
+                for position, keyword in enumerate(keywords):
+                    roles.setdefault(keyword, []).append((group, strength, 0, position, keyword))
+
+        automaton = ahocorasick.Automaton()
+        for keyword, keyword_roles in roles.items():
+            automaton.add_word(keyword, tuple(keyword_roles))
+        automaton.make_automaton()
+        return automaton
+
+    def _build_user_category_matcher(
+            self,
+            category_names: Tuple[str, ...]
+    ) -> Tuple[Optional[ahocorasick.Automaton], Tuple[Tuple[str, str, Tuple[str, ...]], ...]]:
+        """
+        Automaton over the user's full category names and their long words
+
+        Returns the automaton (None if there is nothing to index) and the
+        (name, lowered name, long words) entries in category order.
+        """
+        automaton = ahocorasick.Automaton()
+        entries = []
+        for name in category_names:
+            name_lower = name.lower()
+            words = tuple(w for w in name_lower.split() if len(w) > 3)
+            entries.append((name, name_lower, words))
+            for key in (name_lower, *words):
+                if key:
+                    automaton.add_word(key, key)
+
+        if not len(automaton):
+            return None, tuple(entries)
+        automaton.make_automaton()
+        return automaton, tuple(entries)
+
+    def _scan(self, text_lower: str) -> List[Tuple]:
+        """Roles of all keywords found in the text, each keyword counted once"""
+        seen = set()
+        hits = []
+        for _, keyword_roles in self._automaton.iter(text_lower):
+            keyword = keyword_roles[0][4]
+            if keyword not in seen:
+                seen.add(keyword)
+                hits.extend(keyword_roles)
+        hits.sort()
+        return hits
+
+    def parse(
             self,
             text: str,
-            user_id: int,
             user_categories: Optional[Sequence] = None
     ) -> Dict:
         """
@@ -97,30 +196,52 @@ class ExpenseParser:
         - Multiple: "45k taxi, 15k snacks, 30k coffee"
         - Income: "received 5k salary"
         """
+        return self._parse_text(text, self._category_names_of(user_categories))
+
+    def parse_many(
+            self,
+            texts: Sequence[str],
+            user_categories: Optional[Sequence] = None
+    ) -> List[Dict]:
+        """Parse several texts for the same user, normalizing their categories once"""
+        category_names = self._category_names_of(user_categories)
+        return [self._parse_text(text, category_names) for text in texts]
+
+    @staticmethod
+    def _category_names_of(user_categories: Optional[Sequence]) -> Tuple[str, ...]:
+        """Hashable projection of the user's categories, as used by the rule cache"""
+        return tuple(cat.name for cat in user_categories) if user_categories else ()
+
+    def _parse_text(self, text: str, category_names: Tuple[str, ...]) -> Dict:
         text = text.strip()
 
         # Check for multiple transactions (comma-separated)
-        if ',' in text and self._has_multiple_expenses(text):
-            return await self._parse_multiple(text, user_id, user_categories)
+        if self._has_multiple_expenses(text):
+            return self._parse_multiple(text, category_names)
 
         # Single transaction
-        return await self._parse_single(text, user_id, user_categories)
+        return self._parse_single(text, category_names)
 
     def _has_multiple_expenses(self, text: str) -> bool:
         """Check if text contains multiple expenses"""
-        # Count amounts in text
-        amounts = self.amount_pattern.findall(text)
-        currency_amounts = self.currency_pattern.findall(text)
-
-        total_amounts = len(amounts) + len(currency_amounts)
+        # Multiple expenses are comma-separated
+        if ',' not in text:
+            return False
+
+        # Count amounts in text, stopping at the second one
+        count = 0
+        for pattern in (self.amount_pattern, self.currency_pattern):
+            for _ in pattern.finditer(text):
+                count += 1
+                if count >= 2:
+                    return True
 
-        return total_amounts >= 2 and ',' in text
+        return False
 
-    async def _parse_multiple(
+    def _parse_multiple(
             self,
             text: str,
-            user_id: int,
-            user_categories: Optional[List] = None
+            category_names: Tuple[str, ...] = ()
     ) -> Dict:
         """
         Parse multiple expenses from comma-separated text
@@ -134,7 +255,7 @@ class ExpenseParser:
             if not part:
                 continue
 
-            result = await self._parse_single(part, user_id, user_categories)
+            result = self._parse_single(part, category_names)
 
             if result.get('amount'):  # Only add if valid
                 transactions.append({
@@ -147,7 +268,7 @@ class ExpenseParser:
 
         if not transactions:
             # Failed to parse any - return single parse attempt
-            return await self._parse_single(text, user_id, user_categories)
+            return self._parse_single(text, category_names)
 
         return {
             'is_multiple': True,
@@ -157,24 +278,18 @@ class ExpenseParser:
             'method': 'multi_parse'
         }
 
-    async def _parse_single(
+    def _parse_single(
             self,
             text: str,
-            user_id: int,
-            user_categories: Optional[List] = None
+            category_names: Tuple[str, ...] = ()
     ) -> Dict:
         """Parse single transaction"""
 
-        # Detect transaction type FIRST (income vs expense)
-        transaction_type, type_confidence = self._detect_transaction_type(text)
-
-        # Fast path: Try rule-based parsing
-        result = self._parse_with_rules(text, user_categories)
-        result['type'] = transaction_type
-        result['type_confidence'] = type_confidence
+        # Fast path: Try rule-based parsing (detects income vs expense too)
+        result = self._parse_with_rules(text, category_names)
 
         # Adjust confidence based on type detection
-        if type_confidence < 0.7:
+        if result['type_confidence'] < 0.7:
             result['confidence'] *= 0.9  # Slight penalty for unclear type
 
         # Mark if needs clarification
@@ -183,25 +298,26 @@ class ExpenseParser:
 
         return result
 
-    def _detect_transaction_type(self, text: str) -> Tuple[str, float]:
+    def _detect_transaction_type(self, text_lower: str) -> Tuple[str, float]:
         """
-        Detect if this is income or expense
+        Detect if this is income or expense from already lowercased text
 
         Returns: (type, confidence)
         """
-        text_lower = text.lower()
-
-        # Check strong income indicators
-        strong_income_score = sum(2 for indicator in self.income_indicators['strong']
-                                  if indicator in text_lower)
-        weak_income_score = sum(1 for indicator in self.income_indicators['weak']
-                                if indicator in text_lower)
-
-        # Check expense indicators
-        strong_expense_score = sum(2 for indicator in self.expense_indicators['strong']
-                                   if indicator in text_lower)
-        weak_expense_score = sum(1 for indicator in self.expense_indicators['weak']
-                                 if indicator in text_lower)
+        # Strong indicators count 2, weak ones 1
+        strong_income_score = weak_income_score = 0
+        strong_expense_score = weak_expense_score = 0
+        for group, strength, _, _, _ in self._scan(text_lower):
+            if group == _INCOME:
+                if strength == _STRONG:
+                    strong_income_score += 2
+                else:
+                    weak_income_score += 1
+            elif group == _EXPENSE:
+                if strength == _STRONG:
+                    strong_expense_score += 2
+                else:
+                    weak_expense_score += 1
 
         income_score = strong_income_score + weak_income_score * 0.5
         expense_score = strong_expense_score + weak_expense_score * 0.5
@@ -222,20 +338,58 @@ class ExpenseParser:
     def _parse_with_rules(
             self,
             text: str,
-            user_categories: Optional[List] = None
+            category_names: Tuple[str, ...] = ()
     ) -> Dict:
         """
         Fast rule-based parsing with FIXED confidence scoring
         """
+        (
+            transaction_type,
+            type_confidence,
+            amount,
+            category,
+            description,
+            confidence,
+            matched_keywords,
+        ) = self._rules_cached(text, category_names)
+
+        return {
+            'amount': amount,
+            'category': category,
+            'description': description,
+            'confidence': confidence,
+            'method': 'rule_based',
+            'matched_keywords': list(matched_keywords),
+            'raw_text': text,
+            'type': transaction_type,
+            'type_confidence': type_confidence,
+        }
+
+    def _apply_rules(
+            self,
+            text: str,
+            category_names: Tuple[str, ...]
+    ) -> Tuple[str, float, Optional[float], Optional[str], str, float, Tuple[str, ...]]:
+        """
+        Pure rule pipeline; results are cached, so it returns an immutable tuple
+
+        The text is lowercased once here and shared by every step except
+        description extraction, which keeps the original casing.
+
+        Returns: (type, type_confidence, amount, category, description, confidence, matched_keywords)
+        """
         text_lower = text.lower()
 
+        # 0. Detect transaction type FIRST (income vs expense)
+        transaction_type, type_confidence = self._detect_transaction_type(text_lower)
+
         # 1. Extract amount (try currency symbols first)
         amount, amount_confidence = self._extract_amount_improved(text_lower)
 
         # 2. Detect category with strict matching
         category, category_confidence, matched_keywords = self._detect_category_strict(
             text_lower,
-            user_categories
+            category_names
         )
 
         # 3. Extract description
@@ -250,27 +404,16 @@ class ExpenseParser:
             len(matched_keywords),
             text_lower
         )
-        data = {
-            'amount': amount,
-            'category': category,
-            'description': description,
-            'confidence': confidence,
-            'method': 'rule_based',
-            'matched_keywords': matched_keywords,
-            'raw_text': text,
-            'type': self._detect_transaction_type(text)[0]
-        }
 
-        return {
-            'amount': amount,
-            'category': category,
-            'description': description,
-            'confidence': confidence,
-            'method': 'rule_based',
-            'matched_keywords': matched_keywords,
-            'raw_text': text,
-            'type': self._detect_transaction_type(text)[0]
-        }
+        return (
+            transaction_type,
+            type_confidence,
+            amount,
+            category,
+            description,
+            confidence,
+            tuple(matched_keywords),
+        )
 
     def _extract_amount_improved(self, text: str) -> Tuple[Optional[float], float]:
         """
@@ -282,7 +425,7 @@ class ExpenseParser:
         currency_match = self.currency_pattern.search(text)
         if currency_match:
             try:
-                amount = float(currency_match.group(1).replace(',', '.'))
+                amount = self._match_to_float(currency_match)
                 return amount, 0.95
             except ValueError:
                 pass
@@ -291,15 +434,13 @@ class ExpenseParser:
         match = self.amount_pattern.search(text)
 
         if match:
-            amount_str = match.group(1).replace(',', '.')
             try:
-                amount = float(amount_str)
+                amount = self._match_to_float(match)
             except ValueError:
                 return None, 0.0
 
-            # Check for multiplier (k, thousand, etc.)
-            match_text = match.group(0).lower()
-            if any(x in match_text for x in ['k', 'к', 'thousand', 'тысяч', 'т', 'thous']):
+            # Every multiplier (k, thousand, etc.) means thousands
+            if match['mul']:
                 amount *= 1000
 
             # High confidence for clear numbers >= 10
@@ -308,10 +449,18 @@ class ExpenseParser:
 
         return None, 0.0
 
+    @staticmethod
+    def _match_to_float(match: re.Match) -> float:
+        """Build the number from the integer and fraction groups, whichever separator was used"""
+        fraction = match['frac']
+        if fraction is None:
+            return float(match['int'])
+        return float(f"{match['int']}.{fraction}")
+
     def _detect_category_strict(
             self,
             text: str,
-            user_categories: Optional[List] = None
+            category_names: Sequence[str] = ()
     ) -> Tuple[Optional[str], float, List[str]]:
         """
         Strict category detection with FIXED scoring
@@ -321,61 +470,52 @@ class ExpenseParser:
         scores = {}
         matched_keywords_map = {}
 
-        # Score default categories
-        for category, data in self.category_keywords.items():
-            score = 0.0
-            matched = []
-
-            # Primary keywords (strong match)
-            for keyword in data['primary']:
-                if keyword in text:
-                    score += 1.0 * data['weight']
-                    matched.append(keyword)
-
-            # Secondary keywords (weaker match)
-            for keyword in data.get('secondary', []):
-                if keyword in text:
-                    score += 0.5 * data['weight']
-                    matched.append(f"{keyword}*")
-
-            if score > 0:
-                scores[category] = score
-                matched_keywords_map[category] = matched
+        # Score default categories; hits arrive in declaration order, so sums and lists match a linear scan
+        for group, index, part, _, keyword in self._scan(text):
+            if group != _CATEGORY:
+                continue
+            category = self._category_names[index]
+            weight = self.category_keywords[category]['weight']
+
+            if part == _PRIMARY:
+                # Primary keywords (strong match)
+                scores[category] = scores.get(category, 0.0) + 1.0 * weight
+                matched_keywords_map.setdefault(category, []).append(keyword)
+            else:
+                # Secondary keywords (weaker match)
+                scores[category] = scores.get(category, 0.0) + 0.5 * weight
+                matched_keywords_map.setdefault(category, []).append(f"{keyword}*")
 
         # Check user's custom categories (HIGHEST priority)
-        if user_categories:
-            for cat in user_categories:
-                cat_name_lower = cat.name.lower()
+        if category_names:
+            automaton, entries = self._user_category_matcher(tuple(category_names))
+            found = {key for _, key in automaton.iter(text)} if automaton else set()
+            found.add('')  # An empty name is a substring of any text
 
+            for name, cat_name_lower, cat_words in entries:
                 # Exact match of full category name
-                if cat_name_lower in text:
-                    return cat.name, 0.95, [cat_name_lower]
+                if cat_name_lower in found:
+                    return name, 0.95, [cat_name_lower]
 
                 # Check individual words in category name
-                cat_words = [w for w in cat_name_lower.split() if len(w) > 3]
                 for word in cat_words:
-                    if word in text:
-                        if cat.name not in scores or scores[cat.name] < 2.5:
-                            scores[cat.name] = 2.5
-                            matched_keywords_map[cat.name] = [word]
-
-        # Get best match
-        if scores:
-            best_category = max(scores.items(), key=lambda x: x[1])
-            category_name = best_category[0]
-            raw_score = best_category[1]
-
+                    if word in found:
+                        if name not in scores or scores[name] < 2.5:
+                            scores[name] = 2.5
+                            matched_keywords_map[name] = [word]
+
+        # Get best match; on ties the first scored category wins, like max()
+        category_name = None
+        raw_score = 0.0
+        for category, score in scores.items():
+            if category_name is None or score > raw_score:
+                category_name = category
+                raw_score = score
+
+        if category_name is not None:
             # FIXED: More generous confidence for clear matches
-            if raw_score >= 3.0:  # Very strong (multiple keywords)
-                confidence = 0.95
-            elif raw_score >= 2.0:  # Strong (primary + secondary or custom)
-                confidence = 0.85
-            elif raw_score >= 1.5:  # Good (one strong keyword)
-                confidence = 0.75
-            elif raw_score >= 1.0:  # Acceptable
-                confidence = 0.65
-            else:  # Weak
-                confidence = 0.45
+            # (>= 3.0 very strong, >= 2.0 strong, >= 1.5 good, >= 1.0 acceptable, else weak)
+            confidence = _CATEGORY_TIER_CONFIDENCE[bisect_right(_CATEGORY_SCORE_TIERS, raw_score)]
 
             return category_name, confidence, matched_keywords_map[category_name]
 
@@ -416,9 +556,8 @@ class ExpenseParser:
         if matched_keyword_count >= 2:
             base_confidence = min(0.98, base_confidence * 1.1)
 
-        # Boost for short, clear messages (less ambiguity)
-        word_count = len(text.split())
-        if word_count <= 4 and matched_keyword_count >= 1:
+        # Boost for short, clear messages (less ambiguity); only split when a keyword matched
+        if matched_keyword_count >= 1 and len(text.split()) <= 4:
             base_confidence = min(0.95, base_confidence * 1.05)
 
         return round(base_confidence, 3)
@@ -440,7 +579,7 @@ class ExpenseParser:
         # Detect potential typos/gibberish
         words = text.lower().split()
         # Simple heuristic: check for very short or very long words
-        suspicious = sum(1 for w in words if len(w) > 15 or (len(w) < 3 and w not in ['i', 'on', 'at', 'to', 'k']))
+        suspicious = sum(1 for w in words if len(w) > 15 or (len(w) < 3 and w not in _COMMON_SHORT_WORDS))
 
         if suspicious > len(words) * 0.4:  # >40% suspicious
             return True
@@ -451,6 +590,10 @@ class ExpenseParser:
 
         return False
 
+    def _strip_keyword(self, match: re.Match) -> str:
+        word = match.group()
+        return '' if word.lower() in self._description_strip_words else word
+
     def _extract_description(self, text: str, amount: Optional[float]) -> str:
         """Extract clean description"""
         # Remove amount patterns
@@ -458,20 +601,12 @@ class ExpenseParser:
             text = self.amount_pattern.sub(' ', text)
             text = self.currency_pattern.sub(' ', text)
 
-        # Remove common indicators
-        for category_data in self.category_keywords.values():
-            for keyword in category_data.get('primary', []) + category_data.get('secondary', []):
-                if len(keyword) <= 3:  # Skip short words
-                    continue
-                text = re.sub(rf'\b{re.escape(keyword)}\b', '', text, flags=re.IGNORECASE)
-
-        # Remove expense indicators
-        for indicator in self.expense_indicators['strong'] + self.expense_indicators['weak']:
-            text = re.sub(rf'\b{re.escape(indicator)}\b', '', text, flags=re.IGNORECASE)
+        # Remove category keywords and expense indicators
+        text = self._word_re.sub(self._strip_keyword, text)
 
         # Clean up
-        text = re.sub(r'\s+', ' ', text).strip()
-        text = re.sub(r'^(for|on|at|in)\s+', '', text, flags=re.IGNORECASE)
+        text = self._whitespace_re.sub(' ', text).strip()
+        text = self._leading_preposition_re.sub('', text)
 
         # Remove special characters at start/end
         text = text.strip('!,.:;-')
@@ -480,4 +615,7 @@ class ExpenseParser:
         if len(text) > 100:
             text = text[:97] + '...'
 
-        return text if text else "Transaction"
\ No newline at end of file
+        return text if text else "Transaction"
+
+
+expense_parser = ExpenseParser()
@@ -1,5 +1,9 @@
+from typing import Dict, List
+
 from sqlalchemy.ext.asyncio import AsyncSession
+from bot.database.engine import db
 from bot.database.models import Transaction
+from bot.utils.helpers import invalidate_monthly_summary
 
 
 class TransactionService:
@@ -24,4 +28,31 @@ class TransactionService:
             description=description,
             payment_method=payment_method,
         )
-        return transaction
\ No newline at end of file
+        invalidate_monthly_summary(user_id)
+        return transaction
+
+    @staticmethod
+    async def create_transactions(transactions: List[Dict]) -> List[Transaction]:
+        """
+        Create several transactions in one INSERT and one commit
+
+        Each dict takes the same keys as create_transaction's arguments.
+        """
+        async with db.session() as session:
+            objs = [
+                Transaction(
+                    user_id=txn['user_id'],
+                    amount=txn['amount'],
+                    category_id=txn['category_id'],
+                    type=txn['transaction_type'],
+                    description=txn.get('description', ""),
+                    payment_method=txn.get('payment_method', "cash"),
+                )
+                for txn in transactions
+            ]
+            session.add_all(objs)
+            await session.flush()
+
+        for user_id in {txn['user_id'] for txn in transactions}:
+            invalidate_monthly_summary(user_id)
+        return objs
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from typing import Dict, Optional
 
-from cachetools import TTLCache
+from cachetools import LRUCache
 import asyncio
 
 from loguru import logger
@@ -20,9 +21,13 @@ class CachedUser:
 class UserService:
     """Centralized user data management with caching"""
 
-    def __init__(self, cache_size: int = 10000, cache_ttl: int = 3600):
-        self._user_cache: TTLCache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
-        self._lock = asyncio.Lock()
+    def __init__(self, cache_size: int = 10000):
+        # Entries only change through update_user_language, so plain LRU eviction is enough
+        self._user_cache: LRUCache = LRUCache(maxsize=cache_size)
+        # In-flight registrations, so concurrent updates from a new user share one DB call
+        self._pending_users: Dict[int, asyncio.Task] = {}
+        # In-flight language lookups, same idea for cache misses in get_user_language
+        self._pending_languages: Dict[int, asyncio.Task] = {}
 
         self._cache_hits = 0
         self._cache_misses = 0
@@ -34,28 +39,51 @@ class UserService:
             self._cache_hits += 1
             return cached.language_code
 
-        self._cache_misses += 1
+        pending = self._pending_languages.get(user_id)
+        if pending is None:
+            self._cache_misses += 1
+            pending = asyncio.ensure_future(self._load_language(user_id, fallback))
+            self._pending_languages[user_id] = pending
+            pending.add_done_callback(lambda _: self._pending_languages.pop(user_id, None))
+
+        # Shielded so a cancelled lookup doesn't cancel the load for the others
+        return await asyncio.shield(pending)
+
+    async def _load_language(self, user_id: int, fallback: str) -> str:
         user = await User.get(user_id)
         language = getattr(user, "language_code", None) or fallback
 
-        async with self._lock:
-            self._user_cache[user_id] = CachedUser(
-                user_id=user_id,
-                language_code=language,
-            )
+        self._user_cache[user_id] = CachedUser(
+            user_id=user_id,
+            language_code=language,
+        )
 
         return language
 
+    def get_cached_language(self, user_id: int) -> Optional[str]:
+        """Get user language from cache only, without awaiting the database"""
+        cached = self._user_cache.get(user_id)
+        if cached is None:
+            return None
+        self._cache_hits += 1
+        return cached.language_code
+
     async def update_user_language(self, user_id: int, language: str) -> None:
         """Update language and invalidate cache"""
         logger.info(f"Updating user language for user {user_id}. Language: {language}")
         await User.update(id_=user_id, language_code=language)
 
-        async with self._lock:
-            self._user_cache[user_id] = CachedUser(
-                user_id=user_id,
-                language_code=language,
-            )
+        self._user_cache[user_id] = CachedUser(
+            user_id=user_id,
+            language_code=language,
+        )
+
+    def is_cached(self, user_id: int) -> bool:
+        """Check if the user is already known, without awaiting the database"""
+        if user_id in self._user_cache:
+            self._cache_hits += 1
+            return True
+        return False
 
     async def ensure_user_exists(self, user) -> None:
         """Create user if doesn't exist, cache their language"""
@@ -66,16 +94,26 @@ class UserService:
             self._cache_hits += 1
             return
 
-        # logger.debug(f"User {user_id} does not exist in cache, adding to cache and creating if needed")
-        self._cache_misses += 1
+        pending = self._pending_users.get(user_id)
+        if pending is None:
+            # logger.debug(f"User {user_id} does not exist in cache, adding to cache and creating if needed")
+            self._cache_misses += 1
+            pending = asyncio.ensure_future(self._register_user(user))
+            self._pending_users[user_id] = pending
+            pending.add_done_callback(lambda _: self._pending_users.pop(user_id, None))
+
+        # Shielded so a cancelled handler doesn't cancel registration for the others
+        await asyncio.shield(pending)
+
+    async def _register_user(self, user) -> None:
+        user_id = user.id
         user_data = self._extract_telegram_data(user)
         user, created = await User.get_or_create(user_id=user_id, defaults=user_data)
 
-        async with self._lock:
-            self._user_cache[user_id] = CachedUser(
-                user_id=user_id,
-                language_code=user.language_code,
-            )
+        self._user_cache[user_id] = CachedUser(
+            user_id=user_id,
+            language_code=user.language_code,
+        )
 
         if created:
             # logger.info(f"User {user_id} has not been registered. Creating default categories.")
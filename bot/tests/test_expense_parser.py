@@ -1,8 +1,9 @@
 """
 Comprehensive tests for ExpenseParser
 """
-import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from bot.services.expense_parser import ExpenseParser
 
@@ -13,9 +14,9 @@ class MockCategory:
         self.name = name
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser():
-    """Create parser instance"""
+    """Create one parser instance shared by all tests; it holds no per-call state"""
     return ExpenseParser()  # No AI for basic tests
 
 
@@ -34,8 +35,7 @@ def sample_categories():
 class TestAmountExtraction:
     """Test amount parsing"""
 
-    @pytest.mark.asyncio
-    async def test_simple_numbers(self, parser):
+    def test_simple_numbers(self, parser):
         """Test simple number formats"""
         test_cases = [
             ("50000 taxi", 50000),
@@ -45,11 +45,10 @@ class TestAmountExtraction:
         ]
 
         for text, expected in test_cases:
-            result = await parser.parse(text, user_id=1)
+            result = parser.parse(text)
             assert result['amount'] == expected, f"Failed for: {text}"
 
-    @pytest.mark.asyncio
-    async def test_k_notation(self, parser):
+    def test_k_notation(self, parser):
         """Test 'k' notation"""
         test_cases = [
             ("50k taxi", 50000),
@@ -60,11 +59,10 @@ class TestAmountExtraction:
         ]
 
         for text, expected in test_cases:
-            result = await parser.parse(text, user_id=1)
+            result = parser.parse(text)
             assert result['amount'] == expected, f"Failed for: {text}"
 
-    @pytest.mark.asyncio
-    async def test_decimal_amounts(self, parser):
+    def test_decimal_amounts(self, parser):
         """Test decimal number support"""
         test_cases = [
             ("25.50 coffee", 25.5),
@@ -73,15 +71,14 @@ class TestAmountExtraction:
         ]
 
         for text, expected in test_cases:
-            result = await parser.parse(text, user_id=1)
+            result = parser.parse(text)
             assert result['amount'] == expected, f"Failed for: {text}"
 
 
 class TestCategoryDetection:
     """Test category detection"""
 
-    @pytest.mark.asyncio
-    async def test_common_categories(self, parser, sample_categories):
+    def test_common_categories(self, parser, sample_categories):
         """Test detection of common categories"""
         test_cases = [
             ("50k taxi", "transport"),
@@ -93,11 +90,10 @@ class TestCategoryDetection:
         ]
 
         for text, expected_cat in test_cases:
-            result = await parser.parse(text, user_id=1, user_categories=sample_categories)
+            result = parser.parse(text, user_categories=sample_categories)
             assert result['category'] == expected_cat, f"Failed for: {text}, got {result['category']}"
 
-    @pytest.mark.asyncio
-    async def test_multilingual(self, parser):
+    def test_multilingual(self, parser):
         """Test Russian/Uzbek language support"""
         test_cases = [
             ("такси 50к", "transport"),
@@ -107,15 +103,13 @@ class TestCategoryDetection:
         ]
 
         for text, expected_cat in test_cases:
-            result = await parser.parse(text, user_id=1)
+            result = parser.parse(text)
             assert result['category'] == expected_cat, f"Failed for: {text}"
 
-    @pytest.mark.asyncio
-    async def test_user_categories(self, parser, sample_categories):
+    def test_user_categories(self, parser, sample_categories):
         """Test matching against user's custom categories"""
-        result = await parser.parse(
+        result = parser.parse(
             "Food & Dining 50k",
-            user_id=1,
             user_categories=sample_categories
         )
         assert result['category'].lower() == "food & dining"
@@ -125,72 +119,59 @@ class TestCategoryDetection:
 class TestConfidenceScoring:
     """Test confidence calculation"""
 
-    @pytest.mark.asyncio
-    async def test_high_confidence(self, parser):
+    @pytest.mark.parametrize("text", [
+        "50k taxi",
+        "lunch 25000",
+        "groceries 120k"
+    ])
+    def test_high_confidence(self, parser, text):
         """Test cases that should have high confidence"""
-        test_cases = [
-            "50k taxi",
-            "lunch 25000",
-            "groceries 120k"
-        ]
-
-        for text in test_cases:
-            result = await parser.parse(text, user_id=1)
-            assert result['confidence'] >= 0.85, f"Low confidence for: {text} ({result['confidence']})"
-
-    @pytest.mark.asyncio
-    async def test_medium_confidence(self, parser):
+        result = parser.parse(text)
+        assert result['confidence'] >= 0.85, f"Low confidence for: {text} ({result['confidence']})"
+
+    @pytest.mark.parametrize("text", [
+        "50k",  # Amount but no category
+        "spent on taxi",  # Category but no amount
+    ])
+    def test_medium_confidence(self, parser, text):
         """Test cases with medium confidence"""
-        test_cases = [
-            "50k",  # Amount but no category
-            "spent on taxi",  # Category but no amount
-        ]
-
-        for text in test_cases:
-            result = await parser.parse(text, user_id=1)
-            assert 0.3 <= result['confidence'] < 0.85, f"Wrong confidence for: {text}"
-
-    @pytest.mark.asyncio
-    async def test_low_confidence(self, parser):
+        result = parser.parse(text)
+        assert 0.3 <= result['confidence'] < 0.85, f"Wrong confidence for: {text}"
+
+    @pytest.mark.parametrize("text", [
+        "hello",
+        "how are you",
+        "spent money"
+    ])
+    def test_low_confidence(self, parser, text):
         """Test ambiguous cases"""
-        test_cases = [
-            "hello",
-            "how are you",
-            "spent money"
-        ]
-
-        for text in test_cases:
-            result = await parser.parse(text, user_id=1)
-            assert result['confidence'] < 0.5, f"Too high confidence for: {text}"
+        result = parser.parse(text)
+        assert result['confidence'] < 0.5, f"Too high confidence for: {text}"
 
 
 class TestEdgeCases:
     """Test edge cases and error handling"""
 
-    @pytest.mark.asyncio
-    async def test_empty_input(self, parser):
+    def test_empty_input(self, parser):
         """Test empty string"""
-        result = await parser.parse("", user_id=1)
+        result = parser.parse("")
         assert result['amount'] is None
         assert result['confidence'] < 0.2
 
-    @pytest.mark.asyncio
-    async def test_very_long_text(self, parser):
+    def test_very_long_text(self, parser):
         """Test long descriptions"""
         text = "bought some groceries at the market " + "blah " * 50 + "150k"
-        result = await parser.parse(text, user_id=1)
+        result = parser.parse(text)
         assert result['amount'] == 150000
         assert len(result['description']) <= 100  # Should be truncated
 
-    @pytest.mark.asyncio
-    async def test_multiple_amounts(self, parser):
+    def test_multiple_amounts(self, parser):
         """Test handling multiple amounts"""
-        result = await parser.parse("spent 50k on taxi and 25k on lunch", user_id=1)
+        result = parser.parse("spent 50k on taxi and 25k on lunch")
         # Should extract the first amount
         assert result['amount'] in [50000, 25000]
 
-    @pytest.mark.asyncio
-    async def test_special_characters(self, parser):
+    def test_special_characters(self, parser):
         """Test special characters"""
         test_cases = [
             "50k taxi!",
@@ -200,15 +181,14 @@ class TestEdgeCases:
         ]
 
         for text in test_cases:
-            result = await parser.parse(text, user_id=1)
+            result = parser.parse(text)
             assert result['amount'] is not None, f"Failed to parse: {text}"
 
 
 class TestPerformance:
     """Performance benchmarks"""
 
-    @pytest.mark.asyncio
-    async def test_parsing_speed(self, parser):
+    def test_parsing_speed(self, parser):
         """Test that rule-based parsing is fast"""
         test_texts = [
                          "50k taxi",
@@ -218,19 +198,18 @@ class TestPerformance:
                          "shopping 200k"
                      ] * 20  # 100 tests
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         for text in test_texts:
-            await parser.parse(text, user_id=1)
+            parser.parse(text)
 
-        elapsed = time.time() - start_time
-        avg_time = elapsed / len(test_texts) * 1000  # ms
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        avg_time = elapsed_ns / len(test_texts) / 1e6  # ms
 
         print(f"\nAverage parsing time: {avg_time:.2f}ms")
         assert avg_time < 5, f"Too slow: {avg_time:.2f}ms per parse"
 
-    @pytest.mark.asyncio
-    async def test_batch_performance(self, parser, sample_categories):
+    def test_batch_performance(self, parser, sample_categories):
         """Test batch parsing performance"""
         texts = [
             "50k taxi", "lunch 25000", "groceries 120k",
@@ -239,14 +218,11 @@ class TestPerformance:
             "netflix 35k"
         ]
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        results = []
-        for text in texts * 10:  # 100 parses
-            result = await parser.parse(text, user_id=1, user_categories=sample_categories)
-            results.append(result)
+        results = parser.parse_many(texts * 10, user_categories=sample_categories)  # 100 parses
 
-        elapsed = time.time() - start_time
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
 
         print(f"\nBatch processing: {len(results)} items in {elapsed:.2f}s")
         print(f"Average: {elapsed / len(results) * 1000:.2f}ms per item")
@@ -254,12 +230,42 @@ class TestPerformance:
         # Should process 100 items in under 1 second
         assert elapsed < 1.0, f"Batch processing too slow: {elapsed:.2f}s"
 
+    def test_concurrent_parsing(self, parser, sample_categories):
+        """Parsing from several threads at once gives the same results as sequential parsing"""
+        texts = [
+            "50k taxi", "lunch 25000", "groceries 120k",
+            "movie ticket 35k", "coffee 15k", "uber 40k",
+            "45k taxi, 15k snacks", "received 5k salary",
+            "Food & Dining 50k", "hello"
+        ] * 10
+
+        expected = [parser.parse(text, user_categories=sample_categories) for text in texts]
+
+        start_ns = time.perf_counter_ns()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda text: parser.parse(text, user_categories=sample_categories), texts))
+
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+
+        print(f"\nConcurrent processing: {len(results)} items in {elapsed:.2f}s")
+
+        assert results == expected
+        assert elapsed < 1.0, f"Concurrent processing too slow: {elapsed:.2f}s"
+
+    def test_parse_many_matches_parse(self, parser, sample_categories):
+        """Batch parsing returns the same results as parsing one by one"""
+        texts = ["50k taxi", "Food & Dining 50k", "45k taxi, 15k snacks", "hello"]
+
+        results = parser.parse_many(texts, user_categories=sample_categories)
+
+        assert results == [parser.parse(text, user_categories=sample_categories) for text in texts]
+
 
 class TestRealWorldExamples:
     """Test with real-world user inputs"""
 
-    @pytest.mark.asyncio
-    async def test_casual_inputs(self, parser):
+    def test_casual_inputs(self, parser):
         """Test natural, casual language"""
         test_cases = [
             ("spent 50 on taxi", 50, "transport"),
@@ -270,21 +276,17 @@ class TestRealWorldExamples:
         ]
 
         for text, expected_amount, expected_cat in test_cases:
-            result = await parser.parse(text, user_id=1)
+            result = parser.parse(text)
 
             # Check amount (allow for 'k' multiplication)
             if result['amount']:
-                amount_matches = (
-                        result['amount'] == expected_amount or
-                        result['amount'] == expected_amount * 1000
-                )
-                assert amount_matches, f"Amount mismatch for '{text}': got {result['amount']}"
+                expected_variants = (expected_amount, expected_amount * 1000)
+                assert result['amount'] in expected_variants, f"Amount mismatch for '{text}': got {result['amount']}"
 
             # Check category
             assert result['category'] == expected_cat, f"Category mismatch for '{text}': got {result['category']}"
 
-    @pytest.mark.asyncio
-    async def test_typos_and_variations(self, parser):
+    def test_typos_and_variations(self, parser):
         """Test tolerance for typos"""
         test_cases = [
             "50k txi",  # typo in taxi
@@ -293,13 +295,13 @@ class TestRealWorldExamples:
         ]
 
         for text in test_cases:
-            result = await parser.parse(text, user_id=1)
+            result = parser.parse(text)
             # Should still extract amount even with typos
             assert result['amount'] is not None, f"Failed to parse amount from: {text}"
 
 
 # Manual benchmark script
-async def benchmark():
+def benchmark():
     """Run manual benchmark"""
     parser = ExpenseParser()
 
@@ -320,22 +322,17 @@ async def benchmark():
     print("EXPENSE PARSER BENCHMARK")
     print("=" * 60)
 
-    total_time = 0
-    successful = 0
-    high_confidence = 0
+    texts = test_cases * 10  # 100 iterations
 
-    for text in test_cases * 10:  # 100 iterations
-        start = time.time()
-        result = await parser.parse(text, user_id=1)
-        elapsed = time.time() - start
-        total_time += elapsed
+    # Time the parses as one block; tallying results afterwards keeps it out of the measurement
+    start_ns = time.perf_counter_ns()
+    results = [parser.parse(text) for text in texts]
+    total_time = (time.perf_counter_ns() - start_ns) / 1e9
 
-        if result['amount'] and result['category']:
-            successful += 1
-        if result['confidence'] >= 0.85:
-            high_confidence += 1
+    successful = sum(1 for result in results if result['amount'] and result['category'])
+    high_confidence = sum(1 for result in results if result['confidence'] >= 0.85)
 
-    total_tests = len(test_cases) * 10
+    total_tests = len(texts)
     avg_time = (total_time / total_tests) * 1000
 
     print(f"\nResults:")
@@ -350,4 +347,4 @@ async def benchmark():
 
 if __name__ == "__main__":
     # Run benchmark
-    asyncio.run(benchmark())
\ No newline at end of file
+    benchmark()
\ No newline at end of file
@@ -1,5 +1,38 @@
-from bot.utils.helpers import get_total_users, get_new_users_today, get_active_users_today, get_active_users_week, \
-    get_transactions_count_today, get_transactions_count_total, get_total_transaction_volume, get_user_retention_stats, \
-    get_top_users_by_transactions, get_popular_categories, get_database_size
-from bot.utils.perf import measure
-from bot.utils.text import get_broadcast_sent_text, get_confirm_broadcast_text, get_broadcast_message
+from importlib import import_module
+
+# Re-exports are imported on first access (PEP 562), so importing a submodule
+# such as bot.utils.formatters doesn't pull in the database helpers
+_LAZY_EXPORTS = {
+    "get_total_users": "bot.utils.helpers",
+    "get_new_users_today": "bot.utils.helpers",
+    "get_active_users_today": "bot.utils.helpers",
+    "get_active_users_week": "bot.utils.helpers",
+    "get_transactions_count_today": "bot.utils.helpers",
+    "get_transactions_count_total": "bot.utils.helpers",
+    "get_total_transaction_volume": "bot.utils.helpers",
+    "get_user_retention_stats": "bot.utils.helpers",
+    "get_top_users_by_transactions": "bot.utils.helpers",
+    "get_popular_categories": "bot.utils.helpers",
+    "get_database_size": "bot.utils.helpers",
+    "get_admin_dashboard": "bot.utils.helpers",
+    "measure": "bot.utils.perf",
+    "get_broadcast_sent_text": "bot.utils.text",
+    "get_confirm_broadcast_text": "bot.utils.text",
+    "get_broadcast_message": "bot.utils.text",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -2,6 +2,47 @@
 Text formatting utilities
 """
 from datetime import datetime
+from functools import lru_cache
+
+# Currency symbols
+_CURRENCY_SYMBOLS = {
+    "UZS": "so'm",
+    "USD": "$",
+    "EUR": "€",
+    "RUB": "₽",
+    "GBP": "£"
+}
+
+# Symbols written before the amount
+_PREFIX_SYMBOLS = frozenset({"$", "€", "£", "₽"})
+
+# Date format codes
+_DATETIME_FORMAT = "%d %b %Y, %H:%M"
+_FULL_DATE_FORMAT = "%d %B %Y"
+_MONTH_YEAR_FORMAT = "%B %Y"
+_DATE_FORMAT = "%d %b %Y"
+_DAY_MONTH_FORMAT = "%d %b"
+
+# Display names of the payment methods the bot stores (see Transaction.payment_method)
+_PAYMENT_METHOD_TITLES = {
+    "cash": "Cash",
+    "card": "Card",
+    "online": "Online",
+    "bank": "Bank",
+}
+
+# Progress bars are sliced from these instead of being built per call
+_BAR_MAX_LENGTH = 64
+_BAR_FULL = "█" * _BAR_MAX_LENGTH
+_BAR_EMPTY = "░" * _BAR_MAX_LENGTH
+
+# Budget status tiers: (minimum percentage, emoji, status), checked top to bottom
+_BUDGET_TIERS = (
+    (100, "🔴", "Exceeded"),
+    (80, "🟠", "Warning"),
+    (50, "🟡", "On Track"),
+)
+_BUDGET_DEFAULT_TIER = (0, "🟢", "Good")
 
 
 def format_amount(amount: float, currency: str = "UZS") -> str:
@@ -15,29 +56,28 @@ def format_amount(amount: float, currency: str = "UZS") -> str:
     Returns:
         Formatted string like "50,000 UZS" or "$50.00"
     """
-    # Currency symbols
-    symbols = {
-        "UZS": "so'm",
-        "USD": "$",
-        "EUR": "€",
-        "RUB": "₽",
-        "GBP": "£"
-    }
-
-    symbol = symbols.get(currency, currency)
-
-    # For UZS, no decimals and use comma separator
+    return _format_with_symbol(amount, currency, _CURRENCY_SYMBOLS.get(currency, currency))
+
+
+def _format_with_symbol(amount: float, currency: str, symbol: str) -> str:
+    """format_amount with the symbol already looked up, for callers formatting several amounts"""
+    # For UZS, no decimals and use space separator
     if currency == "UZS":
-        formatted = f"{int(amount):,}".replace(",", " ")
-        return f"{formatted} {symbol}"
+        return f"{int(amount):_} {symbol}".replace("_", " ")
 
     # For other currencies, use 2 decimals
-    if symbol in ["$", "€", "£", "₽"]:
+    if symbol in _PREFIX_SYMBOLS:
         return f"{symbol}{amount:,.2f}"
 
     return f"{amount:,.2f} {symbol}"
 
 
+@lru_cache(maxsize=4096)
+def _format_minute(ordinal: int, hour: int, minute: int) -> str:
+    """Render a minute-precision timestamp; keyed by plain ints so timezone-aware values don't collide"""
+    return datetime.fromordinal(ordinal).replace(hour=hour, minute=minute).strftime(_DATETIME_FORMAT)
+
+
 def format_transaction_message(transaction, category, currency: str) -> str:
     """
     Format a transaction as a message
@@ -52,29 +92,33 @@ def format_transaction_message(transaction, category, currency: str) -> str:
     """
     type_emoji = "💸" if transaction.type == "expense" else "💰"
 
-    message = f"{type_emoji} <b>{category.icon_emoji} {format_amount(transaction.amount, currency)}</b>\n"
-    message += f"Category: {category.name}\n"
+    date = transaction.date
+    payment_method = transaction.payment_method
+
+    lines = [
+        f"{type_emoji} <b>{category.icon_emoji} {format_amount(transaction.amount, currency)}</b>",
+        f"Category: {category.name}",
+    ]
 
     if transaction.description:
-        message += f"Note: {transaction.description}\n"
+        lines.append(f"Note: {transaction.description}")
 
-    message += f"Date: {transaction.date.strftime('%d %b %Y, %H:%M')}\n"
-    message += f"Method: {transaction.payment_method.title()}"
+    lines.append(f"Date: {_format_minute(date.toordinal(), date.hour, date.minute)}")
+    lines.append(f"Method: {_PAYMENT_METHOD_TITLES.get(payment_method) or payment_method.title()}")
 
-    return message
+    return "\n".join(lines)
 
 
 def format_date_range(start_date: datetime, end_date: datetime) -> str:
-    """Format a date range"""
-    if start_date.date() == end_date.date():
-        return start_date.strftime("%d %B %Y")
-
+    """Format a date range (at most one strftime call per endpoint)"""
     if start_date.year == end_date.year:
         if start_date.month == end_date.month:
-            return f"{start_date.day}-{end_date.day} {start_date.strftime('%B %Y')}"
-        return f"{start_date.strftime('%d %b')} - {end_date.strftime('%d %b %Y')}"
+            if start_date.day == end_date.day:
+                return start_date.strftime(_FULL_DATE_FORMAT)
+            return f"{start_date.day}-{end_date.day} {start_date.strftime(_MONTH_YEAR_FORMAT)}"
+        return f"{start_date.strftime(_DAY_MONTH_FORMAT)} - {end_date.strftime(_DATE_FORMAT)}"
 
-    return f"{start_date.strftime('%d %b %Y')} - {end_date.strftime('%d %b %Y')}"
+    return f"{start_date.strftime(_DATE_FORMAT)} - {end_date.strftime(_DATE_FORMAT)}"
 
 
 def format_percentage(value: float, total: float) -> str:
@@ -82,6 +126,13 @@ def format_percentage(value: float, total: float) -> str:
     if total == 0:
         return "0%"
 
+    if type(value) is int and type(total) is int and value >= 0 and total > 0:
+        # Whole amounts: count tenths of a percent exactly, rounding half to even like .1f does
+        tenths, remainder = divmod(value * 1000, total)
+        if remainder * 2 > total or (remainder * 2 == total and tenths % 2):
+            tenths += 1
+        return f"{tenths // 10}.{tenths % 10}%"
+
     percentage = (value / total) * 100
     return f"{percentage:.1f}%"
 
@@ -98,14 +149,27 @@ def format_progress_bar(current: float, target: float, length: int = 10) -> str:
     Returns:
         Progress bar string like "████████░░ 80%"
     """
+    if length > _BAR_MAX_LENGTH:
+        full, empty = "█" * length, "░" * length
+    else:
+        full, empty = _BAR_FULL, _BAR_EMPTY
+
     if target == 0:
-        return "░" * length + " 0%"
+        return empty[:length] + " 0%"
+
+    if type(current) is int and type(target) is int and current >= 0 and target > 0:
+        # Whole amounts (UZS budgets): integer math only, capped at a full bar
+        current = min(current, target)
+        filled = current * length // target
+        percent, remainder = divmod(current * 100, target)
+        if remainder * 2 > target or (remainder * 2 == target and percent % 2):
+            percent += 1
+        return f"{full[:filled]}{empty[:length - filled]} {percent}%"
 
     percentage = min(current / target, 1.0)
-    filled = int(length * percentage)
-    empty = length - filled
+    filled = max(int(length * percentage), 0)
 
-    bar = "█" * filled + "░" * empty
+    bar = full[:filled] + empty[:length - filled]
     percent_text = f"{percentage * 100:.0f}%"
 
     return f"{bar} {percent_text}"
@@ -127,23 +191,18 @@ def format_budget_status(spent: float, budget: float, currency: str) -> str:
     remaining = budget - spent
 
     # Choose emoji based on status
-    if percentage >= 100:
-        emoji = "🔴"
-        status = "Exceeded"
-    elif percentage >= 80:
-        emoji = "🟠"
-        status = "Warning"
-    elif percentage >= 50:
-        emoji = "🟡"
-        status = "On Track"
-    else:
-        emoji = "🟢"
-        status = "Good"
-
-    message = f"{emoji} <b>{status}</b>\n"
-    message += f"Spent: {format_amount(spent, currency)}\n"
-    message += f"Budget: {format_amount(budget, currency)}\n"
-    message += f"Remaining: {format_amount(remaining, currency)}\n"
-    message += f"\n{format_progress_bar(spent, budget)}"
-
-    return message
\ No newline at end of file
+    _, emoji, status = next(
+        (tier for tier in _BUDGET_TIERS if percentage >= tier[0]),
+        _BUDGET_DEFAULT_TIER
+    )
+
+    symbol = _CURRENCY_SYMBOLS.get(currency, currency)
+
+    return "\n".join((
+        f"{emoji} <b>{status}</b>",
+        f"Spent: {_format_with_symbol(spent, currency, symbol)}",
+        f"Budget: {_format_with_symbol(budget, currency, symbol)}",
+        f"Remaining: {_format_with_symbol(remaining, currency, symbol)}",
+        "",
+        format_progress_bar(spent, budget),
+    ))
@@ -1,21 +1,29 @@
+import asyncio
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional, Sequence, List, Dict
 
 import pytz
+from cachetools import LRUCache, TTLCache
 from aiogram.types import KeyboardButton, Message
 from asyncpg.pgproto.pgproto import timedelta
 from slugify import slugify
-from sqlalchemy import select, func, desc, extract
+from sqlalchemy import Row, select, lambda_stmt, update, delete, func, desc, extract, case, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy.sql.operators import and_
+from sqlalchemy.orm import joinedload
 
 from bot.database import Category, Transaction, Budget, User
+from bot.database.engine import db
+from bot.database.models.transactions import DESCRIPTION_MAX_LENGTH
+from bot.services.category_service import CategoryInfo, invalidate_user_categories, load_user_categories
 
+_TRANSACTION_COLUMNS = frozenset(Transaction.__table__.columns.keys())
 
-async def create_default_categories(user_id: int):
-    """Create default expense/income categories for new user"""
-    default_categories = [
+
+# Slugs are baked in once at import instead of on every signup
+DEFAULT_CATEGORIES = tuple(
+    {**category, "slug": slugify(category["name"])}
+    for category in (
         # Expense categories
         {"name": "Food", "icon_emoji": "🍔", "type": "expense", "color": "#FF6B6B"},
         {"name": "Transport", "icon_emoji": "🚗", "type": "expense", "color": "#4ECDC4"},
@@ -32,17 +40,45 @@ async def create_default_categories(user_id: int):
         {"name": "Investment", "icon_emoji": "📈", "type": "income", "color": "#16A085"},
         {"name": "Gift", "icon_emoji": "🎁", "type": "income", "color": "#52BE80"},
         {"name": "Other Income", "icon_emoji": "💵", "type": "income", "color": "#58D68D"},
-    ]
+    )
+)
+
+_DEFAULT_CATEGORY_ROWS = tuple({**category, "is_default": True} for category in DEFAULT_CATEGORIES)
+_CATEGORY_INSERT = Category.__table__.insert()
+_TRANSACTION_INSERT = Transaction.__table__.insert()
 
-    # Add slug and user info
-    for category in default_categories:
-        category.update({
-            "slug": slugify(category["name"]),
-            "user_id": user_id,
-            "is_default": True,
-        })
+# Rows per executemany batch in create_transactions_bulk
+BULK_CHUNK = 500
 
-    await Category.batch_create(default_categories)
+
+def _utc_now() -> datetime:
+    """Timezone-aware current time; timestamp columns are stored as UTC"""
+    return datetime.now(timezone.utc)
+
+
+def _today_utc() -> datetime:
+    """Midnight UTC of the current day"""
+    return _utc_now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+@lru_cache(maxsize=256)
+def _month_bounds(year: int, month: int) -> tuple:
+    """First moment (UTC) of the month and of the following month"""
+    return (
+        datetime(year, month, 1, tzinfo=timezone.utc),
+        datetime(year + (month == 12), month % 12 + 1, 1, tzinfo=timezone.utc),
+    )
+
+
+async def create_default_categories(user_id: int):
+    """Create default expense/income categories for new user"""
+    # One Core executemany INSERT; no ORM instances or per-row refreshes needed
+    async with db.session() as session:
+        await session.execute(
+            _CATEGORY_INSERT,
+            [{**row, "user_id": user_id} for row in _DEFAULT_CATEGORY_ROWS]
+        )
+    invalidate_user_categories(user_id)
 
 
 
@@ -50,18 +86,10 @@ async def create_default_categories(user_id: int):
 async def get_user_categories(
         user_id: int,
         category_type: Optional[str] = None
-) -> List[Category]:
+) -> Sequence[CategoryInfo]:
     """Get all categories for a user (default + custom)"""
-
-    if category_type:
-        categories = await Category.filter_all(
-            criteria=((Category.user_id == user_id) & (Category.type == category_type))
-        )
-    else:
-        categories = await Category.filter_all(Category.user_id == user_id)
-
-    categories = list(categories)
-    return categories
+    async with db.session() as session:
+        return await load_user_categories(session, user_id, category_type)
 
 
 async def create_custom_category(
@@ -81,7 +109,9 @@ async def create_custom_category(
         "is_default": True,
     }
 
-    return await Category.create(**category)
+    created = await Category.create(**category)
+    invalidate_user_categories(user_id)
+    return created
 
 
 async def create_transaction(
@@ -102,12 +132,37 @@ async def create_transaction(
         "amount": amount,
         "category_id": category_id,
         "description": description or "",
-        "date": date or datetime.now(),
+        "date": date or _utc_now(),
         "payment_method": payment_method,
         "tags": tags or [],
         "photo_url": photo_url
     }
-    return await Transaction.create(**transaction)
+    created = await Transaction.create(**transaction)
+    invalidate_monthly_summary(user_id, transaction["date"])
+    return created
+
+
+async def create_transactions_bulk(session: AsyncSession, rows: List[Dict]) -> None:
+    """Insert many transactions (e.g. an import) with executemany, in chunks
+
+    Each row uses Transaction column names, as built by create_transaction.
+    """
+    now = _utc_now()
+    rows = [
+        {
+            **row,
+            "description": (row.get("description") or "")[:DESCRIPTION_MAX_LENGTH],
+            "date": row.get("date") or now,
+        }
+        for row in rows
+    ]
+
+    for start in range(0, len(rows), BULK_CHUNK):
+        await session.execute(_TRANSACTION_INSERT, rows[start:start + BULK_CHUNK])
+    await session.commit()
+
+    for user_id, year, month in {(row["user_id"], row["date"].year, row["date"].month) for row in rows}:
+        invalidate_monthly_summary(user_id, datetime(year, month, 1))
 
 
 async def get_recent_transactions(
@@ -117,20 +172,63 @@ async def get_recent_transactions(
         days: Optional[int] = None
 ) -> Sequence[Transaction]:
     """Get recent transactions for a user"""
-    query = select(Transaction).where(Transaction.user_id == user_id)
+    # Lambda statements are built and cached once; later calls only rebind
+    # user_id/start_date/limit instead of rebuilding the expression tree
+    query = lambda_stmt(lambda: select(Transaction).where(Transaction.user_id == user_id))
 
     if days:
-        start_date = datetime.now() - timedelta(days=days)
-        query = query.where(Transaction.date >= start_date)
+        start_date = _utc_now() - timedelta(days=days)
+        query += lambda q: q.where(Transaction.date >= start_date)
 
-    query = query.options(selectinload(Transaction.category))
-    query = query.order_by(desc(Transaction.date), desc(Transaction.created_at))
-    query = query.limit(limit)
+    query += lambda q: (
+        q.options(joinedload(Transaction.category))
+        .order_by(desc(Transaction.date), desc(Transaction.created_at))
+        .limit(limit)
+    )
 
     result = await session.execute(query)
     return result.scalars().all()
 
 
+# Columns the read-only listings render; plain rows skip the ORM identity map
+_LISTING_COLUMNS = (
+    Transaction.amount,
+    Transaction.type,
+    Transaction.description,
+    Transaction.date,
+    Category.name.label("category_name"),
+    Category.icon_emoji.label("category_emoji"),
+)
+
+
+async def get_recent_transactions_lite(
+        session: AsyncSession,
+        user_id: int,
+        limit: int = 10
+) -> Sequence[Row]:
+    """Get recent transactions for display as plain rows"""
+    result = await session.execute(lambda_stmt(lambda: (
+        select(*_LISTING_COLUMNS)
+        .join(Transaction.category)
+        .where(Transaction.user_id == user_id)
+        .order_by(desc(Transaction.date), desc(Transaction.created_at))
+        .limit(limit)
+    )))
+    return result.all()
+
+
+async def get_transactions_today_lite(session: AsyncSession, user_id: int) -> Sequence[Row]:
+    """Get today's transactions (UTC) for display as plain rows, oldest first"""
+    today_utc = _today_utc()
+    result = await session.execute(lambda_stmt(lambda: (
+        select(*_LISTING_COLUMNS)
+        .join(Transaction.category)
+        .where(Transaction.user_id == user_id, Transaction.date >= today_utc)
+        .order_by(Transaction.date)
+    )))
+    return result.all()
+
+
 async def get_transactions_by_period(
         session: AsyncSession,
         user_id: int,
@@ -139,93 +237,108 @@ async def get_transactions_by_period(
         transaction_type: Optional[str] = None
 ) -> Sequence[Transaction]:
     """Get transactions within a date range"""
-    query = select(Transaction).where(
-        (Transaction.user_id == user_id) &
-        (Transaction.date >= start_date) &
-        (Transaction.date <= end_date)
-    )
+    query = lambda_stmt(lambda: select(Transaction).where(
+        Transaction.user_id == user_id,
+        Transaction.date >= start_date,
+        Transaction.date <= end_date
+    ))
 
     if transaction_type:
-        query = query.where(Transaction.type == transaction_type)
+        query += lambda q: q.where(Transaction.type == transaction_type)
 
-    query = query.options(selectinload(Transaction.category))
-    query = query.order_by(desc(Transaction.date))
+    query += lambda q: q.options(joinedload(Transaction.category)).order_by(desc(Transaction.date))
 
     result = await session.execute(query)
     return result.scalars().all()
 
 
+# Summaries of past months rarely change and are kept until evicted; the
+# current month is only trusted for a minute. Writes invalidate both.
+_closed_month_summaries: LRUCache = LRUCache(maxsize=4096)
+_current_month_summaries: TTLCache = TTLCache(maxsize=4096, ttl=60)
+
+
+def invalidate_monthly_summary(user_id: int, when: Optional[datetime] = None) -> None:
+    """Drop the cached summary of the month containing `when` (default: now)"""
+    when = when or _utc_now()
+    key = (user_id, when.year, when.month)
+    _closed_month_summaries.pop(key, None)
+    _current_month_summaries.pop(key, None)
+
+
+def _invalidate_user_summaries(user_id: int) -> None:
+    """Drop every cached month of one user"""
+    for cache in (_closed_month_summaries, _current_month_summaries):
+        for key in [key for key in cache.keys() if key[0] == user_id]:
+            cache.pop(key, None)
+
+
 async def get_monthly_summary(
         session: AsyncSession,
         user_id: int,
         year: int,
         month: int
 ) -> Dict:
-    """Get monthly financial summary"""
-    start_date = datetime(year, month, 1)
-    if month == 12:
-        end_date = datetime(year + 1, 1, 1)
-    else:
-        end_date = datetime(year, month + 1, 1)
+    """Get monthly financial summary (cached per user and month)"""
+    now = _utc_now()
+    key = (user_id, year, month)
+    cache = _closed_month_summaries if (year, month) < (now.year, now.month) else _current_month_summaries
 
-    # Total expenses
-    expense_result = await session.execute(
-        select(func.sum(Transaction.amount)).where(
-            (Transaction.user_id == user_id) &
-            (Transaction.type == "expense") &
-            (Transaction.date >= start_date) &
-            (Transaction.date < end_date)
-        )
-    )
-    total_expenses = expense_result.scalar() or 0.0
+    summary = cache.get(key)
+    if summary is None:
+        summary = cache[key] = await _compute_monthly_summary(session, user_id, year, month)
 
-    # Total income
-    income_result = await session.execute(
-        select(func.sum(Transaction.amount)).where(
-            (Transaction.user_id == user_id) &
-            (Transaction.type == "income") &
-            (Transaction.date >= start_date) &
-            (Transaction.date < end_date)
-        )
-    )
-    total_income = income_result.scalar() or 0.0
+    # Hand out a copy so callers can't modify the cached entry
+    return {**summary, "categories": [dict(category) for category in summary["categories"]]}
+
+
+async def _compute_monthly_summary(
+        session: AsyncSession,
+        user_id: int,
+        year: int,
+        month: int
+) -> Dict:
+    start_date, end_date = _month_bounds(year, month)
+
+    is_expense = Transaction.type == "expense"
 
-    # Category breakdown
-    category_result = await session.execute(
+    # Totals, count and the per-category breakdown in one round trip: the
+    # (name, emoji) grouping set gives the breakdown, the empty set the totals
+    result = await session.execute(
         select(
+            func.grouping(Category.name).label('is_total'),
             Category.name,
             Category.icon_emoji,
-            func.sum(Transaction.amount).label('total')
+            func.sum(case((is_expense, Transaction.amount), else_=0.0)).label('expenses'),
+            func.sum(case((Transaction.type == "income", Transaction.amount), else_=0.0)).label('income'),
+            func.count(case((is_expense, Transaction.id))).label('expense_count'),
+            func.count().label('count'),
         )
         .join(Transaction.category)
         .where(
             (Transaction.user_id == user_id) &
-            (Transaction.type == "expense") &
             (Transaction.date >= start_date) &
             (Transaction.date < end_date)
         )
-        .group_by(Category.name, Category.icon_emoji)
-        .order_by(desc('total'))
+        .group_by(func.grouping_sets(tuple_(Category.name, Category.icon_emoji), tuple_()))
     )
 
-    categories = [
-        {
-            "name": row.name,
-            "emoji": row.icon_emoji,
-            "amount": float(row.total)
-        }
-        for row in category_result.all()
-    ]
-
-    # Transaction count
-    count_result = await session.execute(
-        select(func.count(Transaction.id)).where(
-            (Transaction.user_id == user_id) &
-            (Transaction.date >= start_date) &
-            (Transaction.date < end_date)
-        )
-    )
-    transaction_count = count_result.scalar()
+    total_expenses = total_income = 0.0
+    transaction_count = 0
+    categories = []
+    for row in result:
+        if row.is_total:
+            total_expenses = row.expenses or 0.0
+            total_income = row.income or 0.0
+            transaction_count = row.count
+        elif row.expense_count:
+            categories.append({
+                "name": row.name,
+                "emoji": row.icon_emoji,
+                "amount": float(row.expenses)
+            })
+
+    categories.sort(key=lambda category: category["amount"], reverse=True)
 
     return {
         "total_expenses": float(total_expenses),
@@ -237,32 +350,79 @@ async def get_monthly_summary(
     }
 
 
+async def get_user_with_monthly_stats(
+        session: AsyncSession,
+        user_id: int,
+        year: int,
+        month: int
+) -> Optional[tuple]:
+    """Get user row with monthly transaction count and expenses in one query"""
+    start_date, end_date = _month_bounds(year, month)
+
+    in_month = (
+        (Transaction.user_id == User.user_id) &
+        (Transaction.date >= start_date) &
+        (Transaction.date < end_date)
+    )
+    transaction_count = select(func.count()).where(in_month).scalar_subquery()
+    total_expenses = (
+        select(func.coalesce(func.sum(Transaction.amount), 0.0))
+        .where(in_month & (Transaction.type == "expense"))
+        .scalar_subquery()
+    )
+
+    result = await session.execute(
+        select(User, transaction_count, total_expenses).where(User.user_id == user_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    user, count, expenses = row
+    return user, count, float(expenses)
+
+
 async def update_transaction(
         session: AsyncSession,
         transaction_id: int,
         user_id: int,
         **kwargs
 ) -> Optional[Transaction]:
-    """Update an existing transaction"""
-    result = await session.execute(
-        select(Transaction).where(
-            and_(
+    """Update an existing transaction with a single UPDATE ... RETURNING"""
+    values = {key: value for key, value in kwargs.items() if key in _TRANSACTION_COLUMNS}
+    if "description" in values:
+        # Core UPDATE bypasses the model's @validates hook
+        values["description"] = (values["description"] or "")[:DESCRIPTION_MAX_LENGTH]
+
+    if not values:
+        result = await session.execute(
+            select(Transaction).where(
                 Transaction.id == transaction_id,
                 Transaction.user_id == user_id
             )
         )
+        return result.scalar_one_or_none()
+
+    result = await session.execute(
+        update(Transaction)
+        .where(
+            Transaction.id == transaction_id,
+            Transaction.user_id == user_id
+        )
+        .values(**values)
+        .returning(Transaction)
     )
     transaction = result.scalar_one_or_none()
+    await session.commit()
 
-    if not transaction:
+    if transaction is None:
         return None
 
-    for key, value in kwargs.items():
-        if hasattr(transaction, key):
-            setattr(transaction, key, value)
-
-    await session.commit()
-    await session.refresh(transaction)
+    if "date" in values:
+        # The previous month isn't known without another read; drop them all
+        _invalidate_user_summaries(user_id)
+    else:
+        invalidate_monthly_summary(user_id, transaction.date)
     return transaction
 
 
@@ -271,22 +431,22 @@ async def delete_transaction(
         transaction_id: int,
         user_id: int
 ) -> bool:
-    """Delete a transaction"""
+    """Delete a transaction with a single DELETE ... RETURNING"""
     result = await session.execute(
-        select(Transaction).where(
-            and_(
-                Transaction.id == transaction_id,
-                Transaction.user_id == user_id
-            )
+        delete(Transaction)
+        .where(
+            Transaction.id == transaction_id,
+            Transaction.user_id == user_id
         )
+        .returning(Transaction.date)
     )
-    transaction = result.scalar_one_or_none()
+    deleted_date = result.scalar_one_or_none()
+    await session.commit()
 
-    if not transaction:
+    if deleted_date is None:
         return False
 
-    await session.delete(transaction)
-    await session.commit()
+    invalidate_monthly_summary(user_id, deleted_date)
     return True
 
 
@@ -307,7 +467,6 @@ async def create_budget(
         "amount": amount,
         "period": period,
         "alert_threshold": alert_threshold,
-        "start_date": datetime.now()
     }
     return await Budget.create(**budget)
 
@@ -321,12 +480,10 @@ async def get_budget_status(
     result = await session.execute(
         select(Budget)
         .where(
-            and_(
-                Budget.user_id == user_id,
-                Budget.category_id == category_id
-            )
+            Budget.user_id == user_id,
+            Budget.category_id == category_id
         )
-        .options(selectinload(Budget.category))
+        .options(joinedload(Budget.category))
     )
     budget = result.scalar_one_or_none()
 
@@ -334,19 +491,19 @@ async def get_budget_status(
         return None
 
     # Calculate spent amount for current period
-    now = datetime.now()
+    now = _utc_now()
     if budget.period == "monthly":
-        start_date = datetime(now.year, now.month, 1)
+        start_date = _month_bounds(now.year, now.month)[0]
     elif budget.period == "weekly":
         start_date = now - timedelta(days=now.weekday())
     else:  # daily
-        start_date = datetime(now.year, now.month, now.day)
+        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
     spent_result = await session.execute(
         select(func.sum(Transaction.amount)).where(
-            (Transaction.user_id == user_id) &
-            (Transaction.category_id == category_id) &
-            (Transaction.type == "expense") &
+            Transaction.user_id == user_id,
+            Transaction.category_id == category_id,
+            Transaction.type == "expense",
             Transaction.date >= start_date
         )
     )
@@ -372,53 +529,43 @@ async def get_spending_patterns(
         days: int = 30
 ) -> Dict:
     """Analyze spending patterns"""
-    start_date = datetime.now() - timedelta(days=days)
+    start_date = _utc_now() - timedelta(days=days)
 
-    # Day of week pattern
-    dow_result = await session.execute(
-        select(
-            extract('dow', Transaction.date).label('day_of_week'),
-            func.avg(Transaction.amount).label('avg_amount'),
-            func.count(Transaction.id).label('count')
-        )
-        .where(
-            (Transaction.user_id == user_id) &
-            (Transaction.type == "expense") &
-            Transaction.date >= start_date
-        )
-        .group_by('day_of_week')
-        .order_by('day_of_week')
-    )
-
-    day_patterns = {
-        int(row.day_of_week): {
-            "avg_amount": float(row.avg_amount),
-            "count": row.count
-        }
-        for row in dow_result.all()
-    }
-
-    # Top categories
-    top_cats_result = await session.execute(
+    # Weekday pattern and per-category totals in one scan of the window:
+    # the grouping flag tells which grouping set a row belongs to
+    day_of_week = extract('dow', Transaction.date)
+    result = await session.execute(
         select(
+            func.grouping(Category.name).label('is_day_row'),
+            day_of_week.label('day_of_week'),
             Category.name,
-            func.sum(Transaction.amount).label('total')
+            func.avg(Transaction.amount).label('avg_amount'),
+            func.sum(Transaction.amount).label('total'),
+            func.count().label('count')
         )
         .join(Transaction.category)
         .where(
-            (Transaction.user_id == user_id) &
-            (Transaction.type == "expense") &
+            Transaction.user_id == user_id,
+            Transaction.type == "expense",
             Transaction.date >= start_date
         )
-        .group_by(Category.name)
-        .order_by(desc('total'))
-        .limit(5)
+        .group_by(func.grouping_sets(tuple_(day_of_week), tuple_(Category.name)))
     )
 
-    top_categories = [
-        {"name": row.name, "total": float(row.total)}
-        for row in top_cats_result.all()
-    ]
+    day_patterns = {}
+    top_categories = []
+    for row in result:
+        if row.is_day_row:
+            day_patterns[int(row.day_of_week)] = {
+                "avg_amount": float(row.avg_amount),
+                "count": row.count
+            }
+        else:
+            top_categories.append({"name": row.name, "total": float(row.total)})
+
+    day_patterns = dict(sorted(day_patterns.items()))
+    top_categories.sort(key=lambda category: category["total"], reverse=True)
+    del top_categories[5:]
 
     return {
         "day_patterns": day_patterns,
@@ -468,7 +615,7 @@ async def create_category(
     # Check if category already exists for this user (case-insensitive)
     stmt = select(Category).where(
         Category.user_id == user_id,
-        Category.name.ilike(name),
+        func.lower(Category.name) == name.lower(),
         Category.type == type
     )
     result = await session.execute(stmt)
@@ -488,6 +635,7 @@ async def create_category(
     session.add(category)
     await session.commit()
     await session.refresh(category)
+    invalidate_user_categories(user_id)
     return category
 
 
@@ -501,7 +649,7 @@ async def get_total_users(session=None) -> int:
 
 async def get_active_users_today(session: AsyncSession) -> int:
     """Get users who created transactions today"""
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = _today_utc()
 
     result = await session.execute(
         select(func.count(func.distinct(Transaction.user_id)))
@@ -512,7 +660,7 @@ async def get_active_users_today(session: AsyncSession) -> int:
 
 async def get_active_users_week(session: AsyncSession) -> int:
     """Get users who created transactions this week"""
-    week_ago = datetime.now() - timedelta(days=7)
+    week_ago = _utc_now() - timedelta(days=7)
 
     result = await session.execute(
         select(func.count(func.distinct(Transaction.user_id)))
@@ -523,29 +671,27 @@ async def get_active_users_week(session: AsyncSession) -> int:
 
 async def get_new_users_today(session: AsyncSession) -> int:
     """Get users who joined today"""
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = _today_utc()
 
     result = await session.execute(
-        select(func.count(User.user_id))
+        select(func.count())
         .where(User.created_at >= today)
     )
     return result.scalar() or 0
 
 
 async def get_transactions_count_today(session=None, user_id: int = None) -> int:
-    now_utc = datetime.now(timezone.utc)
-    today_utc = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+    today_utc = _today_utc()
 
     if user_id:
-        return await Transaction.count((Transaction.created_at >= today_utc) & (Transaction.user_id == user_id))
-    return await Transaction.count(Transaction.created_at >= today_utc)
+        return await Transaction.count((Transaction.user_id == user_id) & (Transaction.date >= today_utc))
+    return await Transaction.count(Transaction.date >= today_utc)
 
 
 async def get_transactions_today(user_id: int) -> Sequence[Transaction]:
-    now_utc = datetime.now(timezone.utc)
-    today_utc = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+    today_utc = _today_utc()
     transactions = await Transaction.filter_all(
-        (Transaction.created_at >= today_utc) & (Transaction.user_id == user_id),
+        (Transaction.user_id == user_id) & (Transaction.date >= today_utc),
         relationship=Transaction.category
     )
 
@@ -555,7 +701,7 @@ async def get_transactions_today(user_id: int) -> Sequence[Transaction]:
 async def get_transactions_count_total(session: AsyncSession) -> int:
     """Get total transactions ever"""
     result = await session.execute(
-        select(func.count(Transaction.id))
+        select(func.count()).select_from(Transaction)
     )
     return result.scalar() or 0
 
@@ -564,17 +710,12 @@ async def get_total_transaction_volume(session: AsyncSession) -> Dict:
     """Get total money tracked (expenses and income)"""
     result = await session.execute(
         select(
-            Transaction.type,
-            func.sum(Transaction.amount).label('total')
+            func.coalesce(func.sum(Transaction.amount).filter(Transaction.type == "expense"), 0).label('expense'),
+            func.coalesce(func.sum(Transaction.amount).filter(Transaction.type == "income"), 0).label('income')
         )
-        .group_by(Transaction.type)
     )
-
-    volumes = {'expense': 0, 'income': 0}
-    for row in result:
-        volumes[row.type] = row.total or 0
-
-    return volumes
+    row = result.one()
+    return {'expense': float(row.expense), 'income': float(row.income)}
 
 
 async def get_top_users_by_transactions(
@@ -587,7 +728,7 @@ async def get_top_users_by_transactions(
             User.user_id,
             User.username,
             User.first_name,
-            func.count(Transaction.id).label('txn_count')
+            func.count().label('txn_count')
         )
         .join(Transaction, Transaction.user_id == User.user_id)
         .group_by(User.user_id, User.username, User.first_name)
@@ -615,7 +756,7 @@ async def get_popular_categories(
         select(
             Category.name,
             Category.icon_emoji,
-            func.count(Transaction.id).label('usage_count')
+            func.count().label('usage_count')
         )
         .join(Transaction, Transaction.category_id == Category.id)
         .group_by(Category.id, Category.name, Category.icon_emoji)
@@ -636,31 +777,28 @@ async def get_popular_categories(
 async def get_user_retention_stats(session: AsyncSession) -> Dict:
     """Calculate user retention (users who came back after first day)"""
     # Users created more than 1 day ago
-    one_day_ago = datetime.now() - timedelta(days=1)
+    one_day_ago = _utc_now() - timedelta(days=1)
 
+    # Both counts in one pass: the join only keeps transactions made after
+    # the user's first day, so users without one contribute a NULL
     result = await session.execute(
-        select(func.count(User.user_id))
+        select(
+            func.count(func.distinct(User.user_id)).label('old_users'),
+            func.count(func.distinct(Transaction.user_id)).label('retained')
+        )
+        .select_from(User)
+        .outerjoin(
+            Transaction,
+            (Transaction.user_id == User.user_id) &
+            (Transaction.created_at > User.created_at + timedelta(days=1))
+        )
         .where(User.created_at < one_day_ago)
     )
-    old_users = result.scalar() or 0
+    old_users, retained = result.one()
 
     if old_users == 0:
         return {'retention_rate': 0, 'retained_users': 0, 'total_old_users': 0}
 
-    # Of those, how many have transactions after their first day?
-    result = await session.execute(
-        select(func.count(func.distinct(User.user_id)))
-        .select_from(User)
-        .join(Transaction, Transaction.user_id == User.user_id)
-        .where(
-            and_(
-                User.created_at < one_day_ago,
-                Transaction.created_at > User.created_at + timedelta(days=1)
-            )
-        )
-    )
-    retained = result.scalar() or 0
-
     return {
         'retention_rate': round((retained / old_users) * 100, 1),
         'retained_users': retained,
@@ -680,6 +818,52 @@ async def get_database_size(session: AsyncSession) -> Optional[str]:
         return None
 
 
+async def _in_own_session(stat, *args):
+    """Run a session-taking stat on a dedicated pooled session"""
+    async with db.session() as session:
+        return await stat(session, *args)
+
+
+async def get_admin_dashboard() -> Dict:
+    """
+    Gather the admin statistics concurrently
+
+    A session runs one query at a time, so every stat gets its own
+    connection from the pool and the page waits for the slowest query
+    instead of the sum of all of them.
+    """
+    (
+        total_users,
+        new_today,
+        active_today,
+        active_week,
+        txn_today,
+        txn_total,
+        volumes,
+        retention,
+    ) = await asyncio.gather(
+        get_total_users(),
+        _in_own_session(get_new_users_today),
+        _in_own_session(get_active_users_today),
+        _in_own_session(get_active_users_week),
+        get_transactions_count_today(),
+        _in_own_session(get_transactions_count_total),
+        _in_own_session(get_total_transaction_volume),
+        _in_own_session(get_user_retention_stats),
+    )
+
+    return {
+        'total_users': total_users,
+        'new_today': new_today,
+        'active_today': active_today,
+        'active_week': active_week,
+        'txn_today': txn_today,
+        'txn_total': txn_total,
+        'volumes': volumes,
+        'retention': retention,
+    }
+
+
 def get_language_name(code: str) -> str:
     """Get language display name"""
     languages = {
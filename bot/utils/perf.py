@@ -3,9 +3,11 @@ from contextlib import asynccontextmanager
 
 from loguru import logger
 
+from bot.core.config import settings
+
 
 @asynccontextmanager
-async def measure(label: str):
+async def _measure(label: str):
     """
     Async context manager to measure performance of a code block.
     Example:
@@ -18,3 +20,21 @@ async def measure(label: str):
     finally:
         duration = (time.perf_counter() - start) * 1000  # ms
         logger.info(f"[PERF] {label} took {duration:.2f} ms")
+
+
+class _NoopMeasure:
+    """Stand-in for measure() when profiling is off: no generator, no timer calls"""
+
+    __slots__ = ()
+
+    def __call__(self, label: str) -> "_NoopMeasure":
+        return self
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+
+measure = _measure if settings.PROFILING_ENABLED else _NoopMeasure()
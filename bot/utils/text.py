@@ -9,10 +9,10 @@ def get_broadcast_sent_text(status) -> str:
 
 
 def get_confirm_broadcast_text(total_users: int, text: str) -> str:
-    return _(f"📢 <b>Confirm Broadcast</b>\n\n"
+    return _("📢 <b>Confirm Broadcast</b>\n\n"
              "<b>Recipients:</b> {total_users:,} users\n\n"
              "<b>Message:</b>\n{text}\n\n"
-             f"Send this message to all users?").format(total_users=total_users, text=text)
+             "Send this message to all users?").format(total_users=total_users, text=text)
 
 
 def get_broadcast_message() -> str: